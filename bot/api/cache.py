@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Hashable, Optional
+
+from cachetools import TLRUCache
+from fastapi import Request, Response
+
+
+# Seconds per unit for ccxt style timeframes ("5m", "1h", "1d", ...)
+TIMEFRAME_SECONDS = {
+    "m": 60,
+    "h": 60 * 60,
+    "d": 24 * 60 * 60,
+    "w": 7 * 24 * 60 * 60,
+    "M": 30 * 24 * 60 * 60,
+}
+MAX_TTL_SECONDS = 60.0
+
+
+def bar_ttl(timeframe: str) -> float:
+    """
+    Return how long a cached response for this timeframe stays fresh.
+
+    One second per bar minute, capped at a minute (1h -> 60s, 5m -> 5s).
+    Unknown timeframes get the shortest TTL.
+    """
+    try:
+        bar_seconds = int(timeframe[:-1]) * TIMEFRAME_SECONDS[timeframe[-1]]
+    except (IndexError, KeyError, ValueError):
+        return 1.0
+    return min(MAX_TTL_SECONDS, max(1.0, bar_seconds / 60))
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str
+    body: bytes
+    ttl: float
+
+
+class ResponseCache:
+    """Thread safe TTL + LRU cache of serialized JSON responses."""
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self._cache: TLRUCache = TLRUCache(maxsize=maxsize, ttu=self._ttu)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ttu(key: Hashable, value: CachedResponse, now: float) -> float:
+        return now + value.ttl
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, body: bytes, ttl: float) -> CachedResponse:
+        entry = CachedResponse(
+            etag='"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"',
+            body=body,
+            ttl=ttl,
+        )
+        with self._lock:
+            self._cache[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def cached_json_response(request: Request, entry: CachedResponse) -> Response:
+    """Return the cached body, or 304 when the client already has this ETag."""
+    headers = {"ETag": entry.etag}
+    if request.headers.get("if-none-match") == entry.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+__all__ = [
+    "CachedResponse",
+    "ResponseCache",
+    "bar_ttl",
+    "cached_json_response",
+]
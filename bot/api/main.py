@@ -1,26 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Type
+from functools import lru_cache, partial
+from typing import Literal, Optional, Type, Union
 
+import anyio.to_thread
+import numpy as np
 import pandas as pd
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from bot.ai.explanation import generate_explanation
+from bot.api.cache import ResponseCache, bar_ttl, cached_json_response
+from bot.api.responses import ORJSONResponse, dump_json
 from bot.api.schemas import (
+    CandleColumnsResponse,
     CandlesResponse,
     BacktestResponse,
-    BacktestHistoryItem,
     PositionSizingRequest,
     PositionSizingResponse,
     RecentBacktestsResponse,
     RecentSignalsResponse,
-    SignalHistoryItem,
     SignalScanRequest,
     SignalScanResponse,
-    SignalSummary,
     TradeSignalResponse,
     StrategyInfo,
     StrategyListResponse,
@@ -29,7 +35,7 @@ from bot.backtest.engine import Backtester, BacktestResult
 from bot.data.repository import DataRepository
 from bot.engine.risk import calculate_position_sizing
 from bot.engine.orchestrator import SignalEngine
-from bot.indicators.core import add_basic_indicators
+from bot.indicators.core import add_basic_indicators_cached
 from bot.models import (
     TradeSignal,
     TradeAction,
@@ -37,17 +43,33 @@ from bot.models import (
     MarketRegime,
 )
 from bot.strategy.registry import list_all_strategies
-from bot.strategy.trend_continuation import TrendContinuationStrategy
-from bot.strategy.range_reversion import RangeReversionStrategy
 from bot.strategy.base import BaseStrategy
 
 
+# Sync endpoints and the /signals/scan fan-out share anyio's worker threads
+# (40 by default); most of them block on exchange or SQLite I/O.
+THREAD_POOL_SIZE = 64
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    yield
+    # Signal/backtest logs are written in the background; don't lose the tail
+    repository.flush()
+
+
 app = FastAPI(
     title="Crypto Technical Analysis Bot for Beginners",
     description="Beginner friendly crypto trading assistant that turns raw charts into clear BUY / SELL / NO-TRADE ideas.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+# Compress larger JSON payloads (/candles is ~200KB at limit=1000). Added
+# before CORS so the CORS middleware stays outermost and answers preflights.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # --- CORS setup for frontend on Vite dev server ---
 origins = [
     "http://localhost:5173",
@@ -67,16 +89,98 @@ app.add_middleware(
 signal_engine = SignalEngine()
 repository = DataRepository()
 backtester = Backtester(repository)
+response_cache = ResponseCache(maxsize=512)
 
 
 STRATEGY_MAP: dict[str, Type[BaseStrategy]] = {
-    "TrendContinuation": TrendContinuationStrategy,
-    "RangeReversion": RangeReversionStrategy,
+    getattr(strat_cls, "name", strat_cls.__name__): strat_cls
+    for strat_cls in list_all_strategies()
 }
 
 
-@app.get("/signal", response_model=TradeSignalResponse)
+def _build_strategy_list() -> StrategyListResponse:
+    items: list[StrategyInfo] = []
+    for strat_cls in STRATEGY_MAP.values():
+        name = getattr(strat_cls, "name", strat_cls.__name__)
+        description = getattr(strat_cls, "description", "")
+        regimes = getattr(strat_cls, "regimes", [])
+        risk_profile = getattr(strat_cls, "risk_profile", "moderate")
+        items.append(
+            StrategyInfo(
+                name=name,
+                description=description,
+                regimes=regimes,
+                risk_profile=risk_profile,  # type: ignore[arg-type]
+            )
+        )
+    return StrategyListResponse(items=items)
+
+
+# Strategy metadata is static, so serialize it once at import time
+STRATEGY_LIST_JSON = _build_strategy_list().model_dump_json().encode()
+
+CandleLayout = Literal["rows", "columns"]
+
+CANDLE_PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+CANDLE_INDICATOR_COLUMNS = (
+    "ema20",
+    "ema50",
+    "ema200",
+    "rsi14",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "bb_high",
+    "bb_low",
+    "bb_mid",
+    "bb_width",
+)
+
+
+def _no_trade_signal(symbol: str, timeframe: str) -> TradeSignal:
+    """Explicit NO_TRADE signal returned when no strategy found a setup."""
+    return TradeSignal(
+        symbol=symbol,
+        timeframe=timeframe,
+        action=TradeAction.NO_TRADE,
+        strategy_name="NoValidSetup",
+        entry_zone=None,
+        stop_loss=None,
+        take_profits=None,
+        risk_rating=RiskRating.LOW,
+        confidence_score=0.0,
+        regime=MarketRegime.UNKNOWN,
+        context={},
+    )
+
+
+def _signal_response_body(signal: TradeSignal) -> bytes:
+    explanation = generate_explanation(
+        signal=signal,
+        context=signal.context,
+    )
+    return dump_json(
+        {
+            **signal.to_dict(),
+            "simple_explanation": explanation,
+        }
+    )
+
+
+@lru_cache(maxsize=1024)
+def _no_trade_response_body(symbol: str, timeframe: str) -> bytes:
+    """NO_TRADE payloads only vary by market, so render each one once."""
+    return _signal_response_body(_no_trade_signal(symbol, timeframe))
+
+
+@app.get(
+    "/signal",
+    response_model=None,
+    responses={200: {"model": TradeSignalResponse}},
+)
 def get_signal(
+    request: Request,
+    background_tasks: BackgroundTasks,
     symbol: str = Query(..., example="BTC/USDT"),
     timeframe: str = Query(..., example="1h"),
     demo: bool = Query(
@@ -87,11 +191,22 @@ def get_signal(
         None,
         description="Comma-separated list of strategy names to enable (e.g. 'TrendContinuation,RangeReversion'). If omitted, all strategies are considered.",
     ),
-) -> TradeSignalResponse:
+) -> Response:
     enabled_list: list[str] | None = None
     if enabled_strategies:
         enabled_list = [s.strip() for s in enabled_strategies.split(",") if s.strip()]
 
+    cache_key = (
+        "/signal",
+        symbol,
+        timeframe,
+        demo,
+        tuple(sorted(enabled_list)) if enabled_list else None,
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+
     try:
         signal: Optional[TradeSignal] = signal_engine.generate_signal(
             symbol=symbol,
@@ -105,34 +220,23 @@ def get_signal(
 
     # If no strategy found a setup, return an explicit NO_TRADE signal
     if signal is None:
-        signal = TradeSignal(
-            symbol=symbol,
-            timeframe=timeframe,
-            action=TradeAction.NO_TRADE,
-            strategy_name="NoValidSetup",
-            entry_zone=None,
-            stop_loss=None,
-            take_profits=None,
-            risk_rating=RiskRating.LOW,
-            confidence_score=0.0,
-            regime=MarketRegime.UNKNOWN,
-            context={},
-        )
+        signal = _no_trade_signal(symbol, timeframe)
+        body = _no_trade_response_body(symbol, timeframe)
+    else:
+        body = _signal_response_body(signal)
 
-    explanation = generate_explanation(
-        signal=signal,
-        context=signal.context,
-    )
-
-    repository.log_signal(signal)
+    # Persist after the response has been sent
+    background_tasks.add_task(repository.log_signal, signal)
 
-    return TradeSignalResponse(
-        simple_explanation=explanation,
-        **signal.to_dict(),
-    )
+    entry = response_cache.set(cache_key, body, ttl=bar_ttl(timeframe))
+    return cached_json_response(request, entry)
 
-@app.post("/signals/scan", response_model=SignalScanResponse)
-def scan_signals(payload: SignalScanRequest) -> SignalScanResponse:
+@app.post(
+    "/signals/scan",
+    response_model=None,
+    responses={200: {"model": SignalScanResponse}},
+)
+async def scan_signals(payload: SignalScanRequest) -> ORJSONResponse:
     if not payload.symbols:
         raise HTTPException(status_code=400, detail="Symbols list cannot be empty")
 
@@ -143,88 +247,168 @@ def scan_signals(payload: SignalScanRequest) -> SignalScanResponse:
             detail=f"Too many symbols requested. Max {max_symbols} allowed.",
         )
 
-    summaries: list[SignalSummary] = []
-
-    for symbol in payload.symbols:
-        try:
-            signal: Optional[TradeSignal] = signal_engine.generate_signal(
-                symbol=symbol,
+    try:
+        signals = await anyio.to_thread.run_sync(
+            partial(
+                signal_engine.generate_signals_batch,
+                symbols=payload.symbols,
                 timeframe=payload.timeframe,
                 limit=payload.limit,
                 use_mock=payload.demo,
                 enabled_strategies=payload.enabled_strategies,
             )
-        except Exception as exc:
-            print("ERROR while generating signal:", repr(exc))
-            raise HTTPException(
-                status_code=500,
-                detail=f"Signal generation failed for {symbol}: {exc}",
-            )
+        )
+    except Exception as exc:
+        print("ERROR while generating signal:", repr(exc))
+        raise HTTPException(
+            status_code=500,
+            detail=f"Signal generation failed for {exc}",
+        )
 
+    summaries: list[dict] = []
+
+    for symbol, signal in zip(payload.symbols, signals):
         if signal is None:
-            signal = TradeSignal(
-                symbol=symbol,
-                timeframe=payload.timeframe,
-                action=TradeAction.NO_TRADE,
-                strategy_name="NoValidSetup",
-                entry_zone=None,
-                stop_loss=None,
-                take_profits=None,
-                risk_rating=RiskRating.LOW,
-                confidence_score=0.0,
-                regime=MarketRegime.UNKNOWN,
-                context={},
-            )
+            signal = _no_trade_signal(symbol, payload.timeframe)
 
         summaries.append(
-            SignalSummary(
-                symbol=symbol,
-                timeframe=payload.timeframe,
-                action=signal.action,
-                strategy_name=signal.strategy_name,
-                risk_rating=signal.risk_rating,
-                confidence_score=signal.confidence_score,
-                regime=signal.regime,
-                created_at=datetime.utcnow(),
-                simple_explanation=None,
-            )
+            {
+                "symbol": symbol,
+                "timeframe": payload.timeframe,
+                "action": signal.action.value,
+                "strategy_name": signal.strategy_name,
+                "risk_rating": signal.risk_rating.value,
+                "confidence_score": float(signal.confidence_score),
+                "regime": signal.regime.value,
+                "created_at": datetime.utcnow(),
+                "simple_explanation": None,
+            }
         )
 
-    return SignalScanResponse(items=summaries)
+    return ORJSONResponse({"items": summaries})
 
 
-@app.get("/strategies", response_model=StrategyListResponse)
-def list_strategies() -> StrategyListResponse:
+@app.get(
+    "/strategies",
+    response_model=None,
+    responses={200: {"model": StrategyListResponse}},
+)
+def list_strategies() -> Response:
     """Return metadata about all available strategies."""
-    items: list[StrategyInfo] = []
-    for strat_cls in list_all_strategies():
-        name = getattr(strat_cls, "name", strat_cls.__name__)
-        description = getattr(strat_cls, "description", "")
-        regimes = getattr(strat_cls, "regimes", [])
-        risk_profile = getattr(strat_cls, "risk_profile", "moderate")
-        items.append(
-            StrategyInfo(
-                name=name,
-                description=description,
-                regimes=regimes,
-                risk_profile=risk_profile,  # type: ignore[arg-type]
+    return Response(STRATEGY_LIST_JSON, media_type="application/json")
+
+
+def _candle_rows(df: pd.DataFrame) -> list[dict]:
+    """One dict per candle, built from whole columns instead of iterrows()."""
+    # Indicator warmup NaNs (and any missing indicator column) become None so
+    # they serialize as JSON null.
+    row_count = len(df)
+    columns: dict[str, list] = {
+        # datetime64[us] -> datetime happens in numpy, no pandas Timestamp boxing
+        "timestamp": df["timestamp"].to_numpy(dtype="datetime64[us]").tolist(),
+    }
+    for name in CANDLE_PRICE_COLUMNS:
+        columns[name] = df[name].to_numpy(dtype="float64").tolist()
+    for name in CANDLE_INDICATOR_COLUMNS:
+        if name not in df.columns:
+            columns[name] = [None] * row_count
+            continue
+        values = df[name].to_numpy(dtype="float64")
+        nan_mask = np.isnan(values)
+        if nan_mask.any():
+            columns[name] = np.where(nan_mask, None, values.astype(object)).tolist()
+        else:
+            columns[name] = values.tolist()
+
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+
+def _candle_columns(df: pd.DataFrame) -> dict[str, object]:
+    """
+    One array per field, left as numpy arrays for orjson to serialize.
+
+    orjson writes float64 NaN as null and datetime64 as ISO strings, so no
+    per-value Python objects are created at all.
+    """
+    columns: dict[str, object] = {
+        "timestamp": df["timestamp"].to_numpy(dtype="datetime64[us]"),
+    }
+    for name in CANDLE_PRICE_COLUMNS:
+        columns[name] = df[name].to_numpy(dtype="float64")
+    for name in CANDLE_INDICATOR_COLUMNS:
+        if name in df.columns:
+            columns[name] = df[name].to_numpy(dtype="float64")
+        else:
+            columns[name] = [None] * len(df)
+    return columns
+
+
+# Exchange fetches currently running, keyed by (symbol, timeframe, limit)
+_inflight_candles: dict[tuple[str, str, int], asyncio.Future] = {}
+
+
+async def _fetch_candles_coalesced(
+    symbol: str,
+    timeframe: str,
+    limit: int,
+) -> pd.DataFrame:
+    """Fetch recent candles, sharing one exchange call between concurrent requests."""
+    key = (symbol, timeframe, limit)
+    pending = _inflight_candles.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(
+            anyio.to_thread.run_sync(
+                partial(
+                    signal_engine.exchange_client.get_recent_candles,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    limit=limit,
+                )
             )
         )
-    return StrategyListResponse(items=items)
-
-
-@app.get("/candles", response_model=CandlesResponse)
-def get_candles(
+        _inflight_candles[key] = pending
+        pending.add_done_callback(lambda _: _inflight_candles.pop(key, None))
+    # Shield so one cancelled client does not cancel the fetch for the others
+    return await asyncio.shield(pending)
+
+
+def _render_candles(
+    df: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    layout: CandleLayout,
+) -> bytes:
+    df = add_basic_indicators_cached(df, symbol, timeframe)
+    if layout == "columns":
+        payload = {"symbol": symbol, "timeframe": timeframe, **_candle_columns(df)}
+    else:
+        payload = {"symbol": symbol, "timeframe": timeframe, "candles": _candle_rows(df)}
+    return dump_json(payload)
+
+
+@app.get(
+    "/candles",
+    response_model=None,
+    responses={200: {"model": Union[CandlesResponse, CandleColumnsResponse]}},
+)
+async def get_candles(
+    request: Request,
     symbol: str = Query(..., example="BTC/USDT"),
     timeframe: str = Query(..., example="1h"),
     limit: int = Query(200, ge=20, le=1000),
-) -> CandlesResponse:
+    layout: CandleLayout = Query(
+        "rows",
+        description="'rows' returns one object per candle, 'columns' returns one array per field.",
+    ),
+) -> Response:
+    cache_key = ("/candles", symbol, timeframe, limit, layout)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+
     try:
-        df = signal_engine.exchange_client.get_recent_candles(
-            symbol=symbol,
-            timeframe=timeframe,
-            limit=limit,
-        )
+        df = await _fetch_candles_coalesced(symbol, timeframe, limit)
     except Exception as exc:
         print("ERROR while fetching candles:", repr(exc))
         raise HTTPException(status_code=500, detail="Failed to load candles")
@@ -232,40 +416,17 @@ def get_candles(
     if df is None or df.empty:
         raise HTTPException(status_code=404, detail="No candles returned for that market")
 
-    df = add_basic_indicators(df)
-
-    candles = []
-    for _, row in df.iterrows():
-        candles.append(
-            {
-                "timestamp": row["timestamp"].to_pydatetime(),
-                "open": float(row["open"]),
-                "high": float(row["high"]),
-                "low": float(row["low"]),
-                "close": float(row["close"]),
-                "volume": float(row["volume"]),
-                "ema20": None if pd.isna(row.get("ema20")) else float(row.get("ema20")),
-                "ema50": None if pd.isna(row.get("ema50")) else float(row.get("ema50")),
-                "ema200": None if pd.isna(row.get("ema200")) else float(row.get("ema200")),
-                "rsi14": None if pd.isna(row.get("rsi14")) else float(row.get("rsi14")),
-                "macd": None if pd.isna(row.get("macd")) else float(row.get("macd")),
-                "macd_signal": None if pd.isna(row.get("macd_signal")) else float(row.get("macd_signal")),
-                "macd_hist": None if pd.isna(row.get("macd_hist")) else float(row.get("macd_hist")),
-                "bb_high": None if pd.isna(row.get("bb_high")) else float(row.get("bb_high")),
-                "bb_low": None if pd.isna(row.get("bb_low")) else float(row.get("bb_low")),
-                "bb_mid": None if pd.isna(row.get("bb_mid")) else float(row.get("bb_mid")),
-                "bb_width": None if pd.isna(row.get("bb_width")) else float(row.get("bb_width")),
-            }
-        )
-
-    return CandlesResponse(
-        symbol=symbol,
-        timeframe=timeframe,
-        candles=candles,
+    # Indicators and serialization are CPU bound, keep them off the event loop
+    body = await anyio.to_thread.run_sync(
+        partial(_render_candles, df, symbol, timeframe, layout)
     )
+    entry = response_cache.set(cache_key, body, ttl=bar_ttl(timeframe))
+    return cached_json_response(request, entry)
+
 
 @app.get("/backtest", response_model=BacktestResponse)
 def run_backtest(
+    background_tasks: BackgroundTasks,
     symbol: str = Query(..., example="BTC/USDT"),
     timeframe: str = Query(..., example="1h"),
     strategy: str = Query(..., example="TrendContinuation"),
@@ -287,62 +448,41 @@ def run_backtest(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    repository.log_backtest(result)
+    background_tasks.add_task(repository.log_backtest, result)
 
-    return BacktestResponse(**result.__dict__)
+    # BacktestResult fields are already typed by the engine, skip re-validation
+    return BacktestResponse.model_construct(**result.__dict__)
 
 
-@app.get("/backtests/recent", response_model=RecentBacktestsResponse)
-def get_recent_backtests(limit: int = 20) -> RecentBacktestsResponse:
+@app.get(
+    "/backtests/recent",
+    response_model=None,
+    responses={200: {"model": RecentBacktestsResponse}},
+)
+def get_recent_backtests(limit: int = 20) -> ORJSONResponse:
     """
     Return the most recent backtest runs, newest first.
     """
 
     capped_limit = min(max(limit, 1), 100)
+    # Rows come back from the repository already typed and keyed like
+    # BacktestHistoryItem, so they are serialized as-is
     rows = repository.get_recent_backtests(limit=capped_limit)
 
-    items = [
-        BacktestHistoryItem(
-            id=row["id"],
-            created_at=row["created_at"],
-            symbol=row["symbol"],
-            timeframe=row["timeframe"],
-            strategy_name=row["strategy_name"],
-            start=row["start"],
-            end=row["end"],
-            win_rate=row["win_rate"],
-            total_return_pct=row["total_return_pct"],
-            max_drawdown_pct=row["max_drawdown_pct"],
-            profit_factor=row["profit_factor"],
-            trades_count=row["trades_count"],
-        )
-        for row in rows
-    ]
-
-    return RecentBacktestsResponse(items=items)
+    return ORJSONResponse({"items": rows})
 
 
-@app.get("/signals/recent", response_model=RecentSignalsResponse)
-def get_recent_signals(limit: int = 20) -> RecentSignalsResponse:
+@app.get(
+    "/signals/recent",
+    response_model=None,
+    responses={200: {"model": RecentSignalsResponse}},
+)
+def get_recent_signals(limit: int = 20) -> ORJSONResponse:
     capped_limit = min(max(limit, 1), 100)
+    # Same as /backtests/recent: enum columns are stored as their values
     rows = repository.get_recent_signals(limit=capped_limit)
 
-    items = [
-        SignalHistoryItem(
-            id=row["id"],
-            created_at=row["created_at"],
-            symbol=row["symbol"],
-            timeframe=row["timeframe"],
-            action=TradeAction(row["action"]),
-            strategy_name=row["strategy_name"],
-            risk_rating=RiskRating(row["risk_rating"]),
-            confidence_score=float(row["confidence_score"]),
-            regime=MarketRegime(row["regime"]),
-        )
-        for row in rows
-    ]
-
-    return RecentSignalsResponse(items=items)
+    return ORJSONResponse({"items": rows})
 
 
 @app.post("/risk/position", response_model=PositionSizingResponse)
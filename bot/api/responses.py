@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize content with orjson, accepting numpy scalars and arrays."""
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+__all__ = ["ORJSONResponse", "dump_json"]
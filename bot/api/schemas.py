@@ -122,6 +122,30 @@ class CandlesResponse(BaseModel):
     candles: List[CandleWithIndicators]
 
 
+class CandleColumnsResponse(BaseModel):
+    """Column oriented /candles payload: one array per field, index aligned."""
+
+    symbol: str
+    timeframe: str
+    timestamp: List[datetime]
+    open: List[float]
+    high: List[float]
+    low: List[float]
+    close: List[float]
+    volume: List[float]
+    ema20: List[Optional[float]]
+    ema50: List[Optional[float]]
+    ema200: List[Optional[float]]
+    rsi14: List[Optional[float]]
+    macd: List[Optional[float]]
+    macd_signal: List[Optional[float]]
+    macd_hist: List[Optional[float]]
+    bb_high: List[Optional[float]]
+    bb_low: List[Optional[float]]
+    bb_mid: List[Optional[float]]
+    bb_width: List[Optional[float]]
+
+
 class SignalHistoryItem(BaseModel):
     id: int
     created_at: datetime
@@ -148,6 +172,7 @@ __all__ = [
     "RecentBacktestsResponse",
     "CandleWithIndicators",
     "CandlesResponse",
+    "CandleColumnsResponse",
     "SignalHistoryItem",
     "RecentSignalsResponse",
     "PositionSizingRequest",
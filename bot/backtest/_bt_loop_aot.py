@@ -0,0 +1,28 @@
+"""
+Ahead-of-time build of the backtest kernel.
+
+    python -m bot.backtest._bt_loop_aot
+
+writes a bt_loop extension module next to this file. Backtester imports it
+when present, so processes skip the JIT compile of simulate_trades; without
+it the numba (or pure Python) kernel is used.
+"""
+from __future__ import annotations
+
+import os
+
+from numba.pycc import CC
+
+from bot.backtest.kernels import simulate_trades
+
+cc = CC("bt_loop")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export(
+    "simulate_trades",
+    "f8[:](f8[:], f8[:], f8[:], i1[:], f8[:], f8[:])",
+)(getattr(simulate_trades, "py_func", simulate_trades))
+
+
+if __name__ == "__main__":
+    cc.compile()
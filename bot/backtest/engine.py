@@ -1,18 +1,28 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional, Type
+from functools import partial
+from typing import List, Optional, Sequence, Type
 
-import pandas as pd
+import numpy as np
 
+try:  # ahead-of-time build from bot/backtest/_bt_loop_aot.py
+    from bot.backtest.bt_loop import simulate_trades
+except ImportError:
+    from bot.backtest.kernels import simulate_trades
 from bot.data.repository import DataRepository
 from bot.indicators.core import add_basic_indicators
-from bot.engine.regime import detect_regime
-from bot.models import TradeAction, TradeSignal
+from bot.engine.regime import detect_regimes
 from bot.strategy.base import BaseStrategy
 
 
+# Same warmup guard as SignalEngine: no signals on less history than this
+MIN_HISTORY_ROWS = 120
+
+
 @dataclass
 class BacktestResult:
     symbol: str
@@ -48,101 +58,42 @@ class Backtester:
         """Run a bar by bar backtest."""
         candles = self.repository.load_candles(symbol, timeframe, start, end)
         candles = add_basic_indicators(candles)
-        candles = candles.dropna()
+        # Positional index so bar i's history is exactly the first i + 1 rows
+        candles = candles.dropna().reset_index(drop=True)
 
         if candles.empty:
             raise ValueError("No candles available for the requested range")
 
         strategy = strategy_cls()
 
-        trades: list[float] = []
-        equity = 1.0
-        peak_equity = 1.0
-        max_drawdown = 0.0
-        position: Optional[Dict] = None
-
-        def close_position(exit_price: float) -> None:
-            nonlocal equity, peak_equity, max_drawdown, position
-            if position is None:
-                return
-            pct_return = (
-                (exit_price - position["entry_price"])
-                / position["entry_price"]
-                * position["direction"]
-            )
-            trades.append(pct_return)
-            equity *= 1 + pct_return
-            peak_equity = max(peak_equity, equity)
-            if peak_equity > 0:
-                drawdown = (peak_equity - equity) / peak_equity
-                max_drawdown = max(max_drawdown, drawdown)
-            position = None
-
-        for idx, row in candles.iterrows():
-            history = candles.iloc[: idx + 1]
-            regime = detect_regime(history)
-            signal: Optional[TradeSignal] = strategy.generate_signal(
-                history, symbol, timeframe, regime
-            )
-
-            high = float(row["high"])
-            low = float(row["low"])
-            close = float(row["close"])
-
-            if position:
-                exit_price: Optional[float] = None
-                if position["direction"] == 1:
-                    if (
-                        position.get("stop_loss") is not None
-                        and low <= float(position["stop_loss"])
-                    ):
-                        exit_price = float(position["stop_loss"])
-                    elif (
-                        position.get("take_profit") is not None
-                        and high >= float(position["take_profit"])
-                    ):
-                        exit_price = float(position["take_profit"])
-                    elif signal and signal.action == TradeAction.SELL:
-                        exit_price = close
-                else:
-                    if (
-                        position.get("stop_loss") is not None
-                        and high >= float(position["stop_loss"])
-                    ):
-                        exit_price = float(position["stop_loss"])
-                    elif (
-                        position.get("take_profit") is not None
-                        and low <= float(position["take_profit"])
-                    ):
-                        exit_price = float(position["take_profit"])
-                    elif signal and signal.action == TradeAction.BUY:
-                        exit_price = close
-
-                if exit_price is not None:
-                    close_position(exit_price)
-
-            if position is None and signal and signal.action in (
-                TradeAction.BUY,
-                TradeAction.SELL,
-            ):
-                direction = 1 if signal.action == TradeAction.BUY else -1
-                take_profit = signal.take_profits[0] if signal.take_profits else None
-                stop_loss = signal.stop_loss
-                position = {
-                    "direction": direction,
-                    "entry_price": close,
-                    "take_profit": take_profit,
-                    "stop_loss": stop_loss,
-                }
-
-        # Close any open position at the final close
-        if position is not None:
-            close_position(float(candles.iloc[-1]["close"]))
+        # Regimes and signals for every bar in one pass each. Bar i only ever
+        # sees rows up to and including i, and nothing fires before there is
+        # as much history as the live engine requires.
+        regimes = detect_regimes(candles)
+        signals = strategy.precompute_signals(
+            candles, symbol, timeframe, regimes, start=MIN_HISTORY_ROWS - 1
+        )
+
+        trades = simulate_trades(
+            candles["high"].to_numpy(dtype=np.float64),
+            candles["low"].to_numpy(dtype=np.float64),
+            candles["close"].to_numpy(dtype=np.float64),
+            signals.actions,
+            signals.stop_losses,
+            signals.take_profits,
+        )
+
+        # Equity curve starting from 1.0, which is also the first peak
+        equity_curve = np.cumprod(np.concatenate(([1.0], 1.0 + trades)))
+        peaks = np.maximum.accumulate(equity_curve)
+        equity = float(equity_curve[-1])
+        max_drawdown = float((1.0 - equity_curve / peaks).max())
 
         trades_count = len(trades)
-        wins = len([t for t in trades if t > 0])
-        gross_profit = sum(t for t in trades if t > 0)
-        gross_loss = abs(sum(t for t in trades if t < 0))
+        winners = trades[trades > 0]
+        wins = len(winners)
+        gross_profit = float(winners.sum())
+        gross_loss = float(-trades[trades < 0].sum())
 
         win_rate = (wins / trades_count * 100) if trades_count else 0.0
         total_return_pct = (equity - 1) * 100
@@ -165,3 +116,58 @@ class Backtester:
         )
 
         return result
+
+    def run_portfolio(
+        self,
+        symbols: Sequence[str],
+        timeframe: str,
+        strategy_cls: Type[BaseStrategy],
+        start: datetime,
+        end: datetime,
+        max_workers: Optional[int] = None,
+    ) -> List[BacktestResult]:
+        """
+        Run the same backtest for several symbols across CPU cores.
+
+        Each worker process opens its own DataRepository on this repository's
+        database file and candle storage. Results are returned in symbol order.
+        """
+        if len(symbols) <= 1:
+            return [
+                self.run_backtest(symbol, timeframe, strategy_cls, start, end)
+                for symbol in symbols
+            ]
+
+        workers = min(len(symbols), max_workers or os.cpu_count() or 1)
+        run = partial(
+            _run_backtest_in_worker,
+            self.repository.db_path,
+            self.repository.candles_dir,
+            self.repository.candles_duckdb,
+            timeframe=timeframe,
+            strategy_cls=strategy_cls,
+            start=start,
+            end=end,
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, symbols))
+
+
+def _run_backtest_in_worker(
+    db_path: str,
+    candles_dir: Optional[str],
+    candles_duckdb: Optional[str],
+    symbol: str,
+    timeframe: str,
+    strategy_cls: Type[BaseStrategy],
+    start: datetime,
+    end: datetime,
+) -> BacktestResult:
+    backtester = Backtester(DataRepository(db_path, candles_dir, candles_duckdb))
+    try:
+        return backtester.run_backtest(symbol, timeframe, strategy_cls, start, end)
+    finally:
+        backtester.repository.close()
+
+
+__all__ = ["BacktestResult", "Backtester", "MIN_HISTORY_ROWS"]
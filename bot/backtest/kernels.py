@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+
+from bot.jit import njit
+
+
+@njit(cache=True)
+def simulate_trades(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    actions: np.ndarray,
+    stop_losses: np.ndarray,
+    take_profits: np.ndarray,
+) -> np.ndarray:
+    """
+    Replay per-bar signals through the position state machine.
+
+    actions holds +1 (BUY), -1 (SELL) or 0 (no signal) for each bar, with the
+    signal's stop loss and first take profit alongside (NaN when unset).
+    An open position exits at its stop, then its take profit, then on an
+    opposite signal at the close. A flat book enters at the close of any
+    BUY/SELL bar. Returns the percentage return of every closed trade.
+    """
+    n = close.shape[0]
+    returns = np.empty(n + 1)
+    count = 0
+
+    direction = 0
+    entry_price = np.nan
+    stop_loss = np.nan
+    take_profit = np.nan
+
+    for i in range(n):
+        action = actions[i]
+
+        if direction != 0:
+            # Exit checks as flag arithmetic and selects rather than nested
+            # branches; NaN levels never compare true, so unset levels never hit.
+            is_long = direction > 0
+            is_short = direction < 0
+            stop_hit = (is_long & (low[i] <= stop_loss)) | (
+                is_short & (high[i] >= stop_loss)
+            )
+            target_hit = (is_long & (high[i] >= take_profit)) | (
+                is_short & (low[i] <= take_profit)
+            )
+            reversal = action == -direction
+            exit_price = (
+                stop_loss
+                if stop_hit
+                else (take_profit if target_hit else (close[i] if reversal else np.nan))
+            )
+
+            if exit_price == exit_price:
+                returns[count] = (exit_price - entry_price) / entry_price * direction
+                count += 1
+                direction = 0
+
+        if direction == 0 and action != 0:
+            direction = action
+            entry_price = close[i]
+            stop_loss = stop_losses[i]
+            take_profit = take_profits[i]
+
+    # Close any open position at the final close
+    if direction != 0:
+        returns[count] = (close[n - 1] - entry_price) / entry_price * direction
+        count += 1
+
+    return returns[:count]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import duckdb
+
+    DUCKDB_AVAILABLE = True
+except ImportError:  # duckdb is optional
+    DUCKDB_AVAILABLE = False
+
+
+CANDLE_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+_CREATE_CANDLES_SQL = """
+    CREATE TABLE IF NOT EXISTS candles (
+        symbol VARCHAR NOT NULL,
+        timeframe VARCHAR NOT NULL,
+        timestamp BIGINT NOT NULL,
+        open DOUBLE NOT NULL,
+        high DOUBLE NOT NULL,
+        low DOUBLE NOT NULL,
+        close DOUBLE NOT NULL,
+        volume DOUBLE NOT NULL,
+        PRIMARY KEY (symbol, timeframe, timestamp)
+    )
+"""
+
+_INSERT_CANDLES_SQL = """
+    INSERT OR IGNORE INTO candles
+    SELECT ?, ?, timestamp, open, high, low, close, volume FROM incoming
+"""
+
+
+class DuckDBCandleStore:
+    """
+    Candle storage in a DuckDB database file.
+
+    Inserts and range reads run inside DuckDB's columnar engine and move whole
+    pandas frames in and out, with no per row Python cursor work. Timestamps
+    are int64 epoch seconds, like the SQLite candles table.
+
+    A connection is only held for the duration of each call, so backtest
+    worker processes can open the same file read only while no save is running.
+    """
+
+    def __init__(self, path: str) -> None:
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("duckdb is required for DuckDB candle storage")
+        self.path = path
+        self._lock = threading.Lock()
+
+    def save(
+        self,
+        symbol: str,
+        timeframe: str,
+        timestamps: np.ndarray,
+        columns: Dict[str, np.ndarray],
+    ) -> None:
+        """Insert candles; rows already stored win, the same as INSERT OR IGNORE."""
+        incoming = pd.DataFrame({"timestamp": timestamps, **columns})
+        with self._lock:
+            conn = duckdb.connect(self.path)
+            try:
+                conn.execute(_CREATE_CANDLES_SQL)
+                conn.register("incoming", incoming)
+                conn.execute(_INSERT_CANDLES_SQL, [symbol, timeframe])
+            finally:
+                conn.close()
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Candles with start_ts <= timestamp <= end_ts (epoch seconds), ascending."""
+        if not os.path.exists(self.path):
+            return pd.DataFrame(columns=CANDLE_COLUMNS)
+
+        query = f"""
+            SELECT {", ".join(CANDLE_COLUMNS)}
+            FROM candles
+            WHERE symbol = ? AND timeframe = ?
+        """
+        params: list = [symbol, timeframe]
+        if start_ts is not None:
+            query += " AND timestamp >= ?"
+            params.append(start_ts)
+        if end_ts is not None:
+            query += " AND timestamp <= ?"
+            params.append(end_ts)
+        query += " ORDER BY timestamp ASC"
+
+        with self._lock:
+            conn = duckdb.connect(self.path, read_only=True)
+            try:
+                return conn.execute(query, params).fetchdf()
+            finally:
+                conn.close()
+
+
+__all__ = ["DUCKDB_AVAILABLE", "DuckDBCandleStore"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pyarrow is optional
+    PYARROW_AVAILABLE = False
+
+
+CANDLE_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+class ParquetCandleStore:
+    """
+    Columnar candle storage, one Parquet file per symbol and timeframe.
+
+    Timestamps are stored as int64 epoch seconds, like the SQLite candles
+    table, so range reads are a row group filter on a sorted column.
+    """
+
+    def __init__(self, root: str) -> None:
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet candle storage")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def path_for(self, symbol: str, timeframe: str) -> Path:
+        return self.root / f"{symbol.replace('/', '_')}_{timeframe}.parquet"
+
+    def save(
+        self,
+        symbol: str,
+        timeframe: str,
+        timestamps: np.ndarray,
+        columns: Dict[str, np.ndarray],
+    ) -> None:
+        """
+        Merge candles into the symbol's file.
+
+        Rows already stored win over incoming rows with the same timestamp, the
+        same as INSERT OR IGNORE. The file is rewritten sorted by timestamp and
+        swapped in atomically so concurrent readers never see a partial file.
+        """
+        path = self.path_for(symbol, timeframe)
+        with self._lock:
+            if path.exists():
+                existing = pq.read_table(path, columns=CANDLE_COLUMNS)
+                timestamps = np.concatenate(
+                    [existing.column("timestamp").to_numpy(), timestamps]
+                )
+                columns = {
+                    name: np.concatenate([existing.column(name).to_numpy(), values])
+                    for name, values in columns.items()
+                }
+
+            # np.unique keeps the first occurrence, i.e. the stored row
+            timestamps, first_rows = np.unique(timestamps, return_index=True)
+            table = pa.table(
+                {
+                    "timestamp": pa.array(timestamps, type=pa.int64()),
+                    **{
+                        name: pa.array(values[first_rows], type=pa.float64())
+                        for name, values in columns.items()
+                    },
+                }
+            )
+
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+
+    def load(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Candles with start_ts <= timestamp <= end_ts (epoch seconds), ascending."""
+        path = self.path_for(symbol, timeframe)
+        if not path.exists():
+            return pd.DataFrame(columns=CANDLE_COLUMNS)
+
+        filters = []
+        if start_ts is not None:
+            filters.append(("timestamp", ">=", start_ts))
+        if end_ts is not None:
+            filters.append(("timestamp", "<=", end_ts))
+        table = pq.read_table(path, columns=CANDLE_COLUMNS, filters=filters or None)
+        return table.to_pandas()
+
+
+__all__ = ["PYARROW_AVAILABLE", "ParquetCandleStore"]
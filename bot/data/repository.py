@@ -1,29 +1,376 @@
 from __future__ import annotations
 
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+from cachetools import LRUCache
+
+from bot.data.duckdb_store import DuckDBCandleStore
+from bot.data.parquet_store import ParquetCandleStore
+
+
+# Candle rows per INSERT statement in save_candles
+CANDLE_INSERT_CHUNK_ROWS = 500
+
+# Recent load_candles results kept per repository
+CANDLE_CACHE_SIZE = 16
+
+# Read only connections kept open per repository for concurrent readers
+READ_POOL_SIZE = 4
+
+# Signal/backtest rows waiting for the background writer, and how many of
+# them it commits per transaction
+WRITE_QUEUE_SIZE = 1024
+WRITE_BATCH_ROWS = 100
+
+# SQL for the hot read/write paths, built once so every call passes the same
+# string and hits the connection's statement cache.
+_INSERT_CANDLES_PREFIX_SQL = """
+    INSERT OR IGNORE INTO candles
+    (symbol, timeframe, timestamp, open, high, low, close, volume)
+    VALUES
+"""
+_INSERT_BACKTEST_SQL = """
+    INSERT INTO backtests (
+        created_at, symbol, timeframe, strategy_name, start, end,
+        win_rate, total_return_pct, max_drawdown_pct, profit_factor, trades_count
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_RECENT_BACKTESTS_SQL = """
+    SELECT
+        id, created_at, symbol, timeframe, strategy_name, start, end,
+        win_rate, total_return_pct, max_drawdown_pct, profit_factor, trades_count
+    FROM backtests
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+_INSERT_SIGNAL_SQL = """
+    INSERT INTO signals (
+        created_at, symbol, timeframe, action, strategy_name, risk_rating,
+        confidence_score, regime, entry_zone_low, entry_zone_high,
+        stop_loss, tp1, tp2
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_RECENT_SIGNALS_SQL = """
+    SELECT
+        id, created_at, symbol, timeframe, action, strategy_name,
+        risk_rating, confidence_score, regime
+    FROM signals
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+
+_CANDLE_RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("volume", np.float64),
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def _select_candles_sql(has_start: bool, has_end: bool) -> str:
+    """
+    load_candles query for the given optional bounds.
+
+    Served entirely by idx_candles_sym_tf_ts_ohlcv: an ordered range scan
+    with no table lookups and no sort step.
+    """
+    query = """
+        SELECT timestamp, open, high, low, close, volume
+        FROM candles
+        WHERE symbol = ? AND timeframe = ?
+    """
+    if has_start:
+        query += " AND timestamp >= ?"
+    if has_end:
+        query += " AND timestamp <= ?"
+    return query + " ORDER BY timestamp ASC"
+
+
+@lru_cache(maxsize=64)
+def _insert_candles_sql(row_count: int) -> str:
+    """Multi row candle INSERT for row_count rows."""
+    return _INSERT_CANDLES_PREFIX_SQL + ", ".join(
+        ["(?, ?, ?, ?, ?, ?, ?, ?)"] * row_count
+    )
+
+
+def _epoch_seconds(timestamps: pd.Series) -> np.ndarray:
+    """Whole UTC epoch seconds for a datetime column (naive values are UTC)."""
+    if timestamps.dtype.kind != "M":
+        timestamps = pd.to_datetime(timestamps)
+    # One cast for the whole column; tz-aware values come out as UTC
+    return timestamps.to_numpy(dtype="datetime64[s]").view(np.int64)
+
+
+def _backtest_row(result, created_at: int) -> tuple:
+    """Parameters of _INSERT_BACKTEST_SQL for a BacktestResult."""
+    return (
+        created_at,
+        result.symbol,
+        result.timeframe,
+        result.strategy_name,
+        int(result.start.timestamp()),
+        int(result.end.timestamp()),
+        float(result.win_rate),
+        float(result.total_return_pct),
+        float(result.max_drawdown_pct),
+        float(result.profit_factor),
+        int(result.trades_count),
+    )
+
+
+def _is_row(item) -> bool:
+    """True for a (sql, params) row on the write queue, not a marker."""
+    return isinstance(item, tuple)
+
+
+def _signal_row(signal, created_at: int) -> tuple:
+    """Parameters of _INSERT_SIGNAL_SQL for a TradeSignal."""
+    entry_low = None
+    entry_high = None
+    if signal.entry_zone:
+        entry_low, entry_high = signal.entry_zone
+
+    tp1 = None
+    tp2 = None
+    if signal.take_profits:
+        if len(signal.take_profits) > 0:
+            tp1 = signal.take_profits[0]
+        if len(signal.take_profits) > 1:
+            tp2 = signal.take_profits[1]
+
+    return (
+        created_at,
+        signal.symbol,
+        signal.timeframe,
+        getattr(signal.action, "value", signal.action),
+        signal.strategy_name,
+        getattr(signal.risk_rating, "value", signal.risk_rating),
+        float(signal.confidence_score),
+        getattr(signal.regime, "value", signal.regime),
+        entry_low,
+        entry_high,
+        signal.stop_loss,
+        tp1,
+        tp2,
+    )
 
 
 class DataRepository:
     """
     Simple SQLite repository for candles and backtest results.
 
-    This is intentionally minimal for v1.
+    This is intentionally minimal for v1. When candles_dir (or the
+    CANDLES_PARQUET_DIR env var) is set, candles are kept in Parquet files
+    there instead and SQLite only holds backtests and signals. Otherwise,
+    when candles_duckdb (or CANDLES_DUCKDB_PATH) is set, they are kept in
+    that DuckDB database file.
     """
 
-    def __init__(self, db_path: str = "data.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "data.db",
+        candles_dir: Optional[str] = None,
+        candles_duckdb: Optional[str] = None,
+    ) -> None:
         self.db_path = db_path
+        self.candles_dir = candles_dir or os.getenv("CANDLES_PARQUET_DIR")
+        self.candles_duckdb = candles_duckdb or os.getenv("CANDLES_DUCKDB_PATH")
+        self.candle_store: Optional[Union[ParquetCandleStore, DuckDBCandleStore]] = None
+        if self.candles_dir:
+            self.candle_store = ParquetCandleStore(self.candles_dir)
+        elif self.candles_duckdb:
+            self.candle_store = DuckDBCandleStore(self.candles_duckdb)
+        # One write connection for the repository's lifetime, shared by the API
+        # worker threads. The lock serializes writes and keeps transactions whole.
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._candle_cache: LRUCache = LRUCache(maxsize=CANDLE_CACHE_SIZE)
+        # Readers take a pooled query_only connection so, under WAL, they don't
+        # wait for the write lock. An in-memory database exists only on the
+        # write connection, so it reads through that instead.
+        self._readers: Optional[queue.SimpleQueue] = (
+            None if db_path == ":memory:" else queue.SimpleQueue()
+        )
+        self._reader_count = 0
         self._init_schema()
+        # Signal and backtest logs are written behind the caller's back by one
+        # thread, which commits whatever has queued up in a single transaction.
+        self._write_queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer = threading.Thread(
+            target=self._write_behind, name="repository-writer", daemon=True
+        )
+        self._writer.start()
 
-    def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        else:
+            # WAL lets readers run alongside a writer and, with
+            # synchronous=NORMAL, only syncs at checkpoints instead of on
+            # every commit.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
 
-    def _init_schema(self) -> None:
-        conn = self._connect()
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block as one write transaction on the shared connection."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        if self._readers is None:
+            with self._lock:
+                yield self._conn
+            return
+
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take an idle reader, opening one while the pool is below its size."""
         try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._reader_count < READ_POOL_SIZE:
+                self._reader_count += 1
+                return self._connect(read_only=True)
+        return self._readers.get()
+
+    def _enqueue_writes(self, sql: str, rows: Iterable[tuple]) -> None:
+        for row in rows:
+            try:
+                self._write_queue.put_nowait((sql, row))
+            except queue.Full:
+                # The writer is behind; write inline rather than drop the row
+                self._write_rows([(sql, row)])
+
+    def _write_rows(self, rows: List[Tuple[str, tuple]]) -> None:
+        """Insert (sql, params) rows in one transaction, in order."""
+        with self._transaction() as conn:
+            for sql, group in groupby(rows, key=itemgetter(0)):
+                conn.executemany(sql, [params for _, params in group])
+
+    def _write_behind(self) -> None:
+        """
+        Writer thread: commit queued rows in batches until close() is called.
+
+        Besides (sql, params) rows the queue carries flush() markers, which are
+        set once every row queued ahead of them is written, and the None that
+        close() puts last.
+        """
+        while True:
+            batch = [self._write_queue.get()]
+            while _is_row(batch[-1]) and len(batch) < WRITE_BATCH_ROWS:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if _is_row(item)]
+            if rows:
+                self._write_batch(rows)
+
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if batch[-1] is None:
+                return
+
+    def _write_batch(self, rows: List[Tuple[str, tuple]]) -> None:
+        """
+        Write a batch from the queue without ever raising into the writer thread.
+
+        If the batch transaction fails, its rows are retried one by one so only
+        the rows that cannot be written are dropped.
+        """
+        try:
+            self._write_rows(rows)
+            return
+        except Exception as exc:
+            if len(rows) == 1:
+                print(f"[DataRepository] Failed to write a queued row: {exc!r}")
+                return
+        for row in rows:
+            try:
+                self._write_rows([row])
+            except Exception as exc:
+                print(f"[DataRepository] Failed to write a queued row: {exc!r}")
+
+    def flush(self) -> None:
+        """
+        Block until every signal/backtest row queued before this call is written.
+
+        Rows logged by other threads while waiting are not waited for.
+        """
+        if not self._writer.is_alive():
+            return
+        written = threading.Event()
+        self._write_queue.put(written)
+        written.wait()
+
+    def close(self) -> None:
+        self._write_queue.put(None)
+        self._writer.join()
+        # Release any flush() that queued its marker behind close()'s None
+        while True:
+            try:
+                item = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                item.set()
+        with self._lock:
+            if self._readers is not None:
+                while self._reader_count:
+                    self._readers.get().close()
+                    self._reader_count -= 1
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+
+    def _init_schema(self) -> None:
+        with self._transaction() as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -41,6 +388,15 @@ class DataRepository:
                 )
                 """,
             )
+            # The UNIQUE constraint already orders rows for load_candles range
+            # scans; carrying OHLCV in the index lets SQLite answer them without
+            # visiting the table.
+            cur.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_candles_sym_tf_ts_ohlcv
+                ON candles(symbol, timeframe, timestamp, open, high, low, close, volume)
+                """,
+            )
             cur.execute(
                 """
                 CREATE TABLE IF NOT EXISTS backtests (
@@ -80,9 +436,15 @@ class DataRepository:
                 )
                 """,
             )
-            conn.commit()
-        finally:
-            conn.close()
+            # Full ANALYZE only to seed planner stats; afterwards PRAGMA optimize
+            # on close refreshes them when they have drifted.
+            has_stats = cur.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone() and cur.execute(
+                "SELECT 1 FROM sqlite_stat1 WHERE tbl = 'candles' LIMIT 1"
+            ).fetchone()
+            if not has_stats:
+                cur.execute("ANALYZE candles")
 
     def _migrate_backtests_table(self, cur: sqlite3.Cursor) -> None:
         """Add any missing columns for the backtests table without dropping data."""
@@ -119,32 +481,46 @@ class DataRepository:
 
         Expects columns: timestamp, open, high, low, close, volume.
         """
-        conn = self._connect()
-        try:
-            rows = [
-                (
-                    symbol,
-                    timeframe,
-                    int(row["timestamp"].timestamp()),
-                    float(row["open"]),
-                    float(row["high"]),
-                    float(row["low"]),
-                    float(row["close"]),
-                    float(row["volume"]),
-                )
-                for _, row in candles.iterrows()
-            ]
-            conn.executemany(
-                """
-                INSERT OR IGNORE INTO candles
-                (symbol, timeframe, timestamp, open, high, low, close, volume)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
+        count = len(candles)
+        timestamps = _epoch_seconds(candles["timestamp"])
+        columns = {
+            name: candles[name].to_numpy(dtype=np.float64)
+            for name in ("open", "high", "low", "close", "volume")
+        }
+
+        if self.candle_store is not None:
+            self.candle_store.save(symbol, timeframe, timestamps, columns)
+            self._forget_candles(symbol, timeframe)
+            return
+
+        # Plain Python lists per column; each statement's flat parameter list
+        # is filled by strided slice assignment, with no per row tuples.
+        value_lists = [timestamps.tolist()]
+        value_lists += [values.tolist() for values in columns.values()]
+
+        with self._transaction() as conn:
+            # Multi row VALUES statements, kept under SQLite's bound parameter limit
+            chunk_rows = min(
+                CANDLE_INSERT_CHUNK_ROWS,
+                conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) // 8,
             )
-            conn.commit()
-        finally:
-            conn.close()
+            for start in range(0, count, chunk_rows):
+                stop = min(start + chunk_rows, count)
+                rows = stop - start
+                params: list = [None] * (8 * rows)
+                params[0::8] = [symbol] * rows
+                params[1::8] = [timeframe] * rows
+                for offset, values in enumerate(value_lists, start=2):
+                    params[offset::8] = values[start:stop]
+                conn.execute(_insert_candles_sql(rows), params)
+        self._forget_candles(symbol, timeframe)
+
+    def _forget_candles(self, symbol: str, timeframe: str) -> None:
+        """Drop memoized load_candles results for symbol and timeframe."""
+        with self._lock:
+            stale = [key for key in self._candle_cache if key[:2] == (symbol, timeframe)]
+            for key in stale:
+                del self._candle_cache[key]
 
     def load_candles(
         self,
@@ -153,76 +529,75 @@ class DataRepository:
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
     ) -> pd.DataFrame:
-        """Load candles for symbol and timeframe from DB."""
-        conn = self._connect()
-        try:
+        """
+        Load candles for symbol and timeframe from DB.
+
+        Results that already reach `end` are memoized until this repository
+        saves candles for the same symbol and timeframe, so repeated backtests
+        over a range read it once. Empty, open ended or partial ranges are read
+        again every call, since another process may still be writing the bars
+        they lack. The returned frame is shared between callers and must not be
+        mutated.
+        """
+        start_ts = int(start.timestamp()) if start else None
+        end_ts = int(end.timestamp()) if end else None
+        key = (symbol, timeframe, start_ts, end_ts)
+        with self._lock:
+            cached = self._candle_cache.get(key)
+        if cached is not None:
+            return cached
+
+        df = self._read_candles(symbol, timeframe, start_ts, end_ts)
+        # Stored bars never change (INSERT OR IGNORE), so a range whose last bar
+        # reaches end is complete
+        if (
+            end_ts is not None
+            and len(df)
+            and int(df["timestamp"].to_numpy().view(np.int64)[-1]) >= end_ts
+        ):
+            with self._lock:
+                self._candle_cache[key] = df
+        return df
+
+    def _read_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_ts: Optional[int],
+        end_ts: Optional[int],
+    ) -> pd.DataFrame:
+        if self.candle_store is not None:
+            df = self.candle_store.load(symbol, timeframe, start_ts, end_ts)
+        else:
             params: list = [symbol, timeframe]
-            query = """
-                SELECT timestamp, open, high, low, close, volume
-                FROM candles
-                WHERE symbol = ? AND timeframe = ?
-            """
-            if start:
-                query += " AND timestamp >= ?"
-                params.append(int(start.timestamp()))
-            if end:
-                query += " AND timestamp <= ?"
-                params.append(int(end.timestamp()))
-            query += " ORDER BY timestamp ASC"
-            df = pd.read_sql_query(query, conn, params=params)
-            if not df.empty:
-                df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s")
-            return df
-        finally:
-            conn.close()
+            params += [ts for ts in (start_ts, end_ts) if ts is not None]
+            query = _select_candles_sql(start_ts is not None, end_ts is not None)
+            with self._read() as conn:
+                # Stream rows into typed numpy columns: no intermediate list and
+                # no per column inference
+                records = np.fromiter(
+                    conn.execute(query, params),
+                    dtype=_CANDLE_RECORD_DTYPE,
+                )
+            df = pd.DataFrame(records)
+
+        # Stored as epoch seconds, so reinterpret rather than parse
+        df["timestamp"] = df["timestamp"].to_numpy(dtype=np.int64).view("datetime64[s]")
+        return df
 
     def log_backtest(self, result) -> None:
         """Persist a backtest result for history browsing."""
 
-        conn = self._connect()
-        try:
-            conn.execute(
-                """
-                INSERT INTO backtests (
-                    created_at, symbol, timeframe, strategy_name, start, end,
-                    win_rate, total_return_pct, max_drawdown_pct, profit_factor, trades_count
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    int(datetime.utcnow().timestamp()),
-                    result.symbol,
-                    result.timeframe,
-                    result.strategy_name,
-                    int(result.start.timestamp()),
-                    int(result.end.timestamp()),
-                    float(result.win_rate),
-                    float(result.total_return_pct),
-                    float(result.max_drawdown_pct),
-                    float(result.profit_factor),
-                    int(result.trades_count),
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        row = _backtest_row(result, int(datetime.utcnow().timestamp()))
+        self._enqueue_writes(_INSERT_BACKTEST_SQL, [row])
 
     def get_recent_backtests(self, limit: int = 20) -> list[dict]:
         """Return the most recent backtests ordered newest first."""
 
-        conn = self._connect()
-        try:
-            cursor = conn.execute(
-                """
-                SELECT
-                    id, created_at, symbol, timeframe, strategy_name, start, end,
-                    win_rate, total_return_pct, max_drawdown_pct, profit_factor, trades_count
-                FROM backtests
-                ORDER BY created_at DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
+        # Include results logged but not yet written
+        self.flush()
+        with self._read() as conn:
+            cursor = conn.execute(_SELECT_RECENT_BACKTESTS_SQL, (limit,))
             rows = cursor.fetchall()
             return [
                 {
@@ -241,72 +616,26 @@ class DataRepository:
                 }
                 for row in rows
             ]
-        finally:
-            conn.close()
 
     def log_signal(self, signal) -> None:
         """Persist a TradeSignal for history/auditing."""
 
-        entry_low = None
-        entry_high = None
-        if signal.entry_zone:
-            entry_low, entry_high = signal.entry_zone
+        self.log_signals([signal])
 
-        tp1 = None
-        tp2 = None
-        if signal.take_profits:
-            if len(signal.take_profits) > 0:
-                tp1 = signal.take_profits[0]
-            if len(signal.take_profits) > 1:
-                tp2 = signal.take_profits[1]
+    def log_signals(self, signals: Iterable) -> None:
+        """Persist several TradeSignals; written by the background writer."""
 
-        conn = self._connect()
-        try:
-            conn.execute(
-                """
-                INSERT INTO signals (
-                    created_at, symbol, timeframe, action, strategy_name, risk_rating,
-                    confidence_score, regime, entry_zone_low, entry_zone_high,
-                    stop_loss, tp1, tp2
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    int(datetime.utcnow().timestamp()),
-                    signal.symbol,
-                    signal.timeframe,
-                    getattr(signal.action, "value", signal.action),
-                    signal.strategy_name,
-                    getattr(signal.risk_rating, "value", signal.risk_rating),
-                    float(signal.confidence_score),
-                    getattr(signal.regime, "value", signal.regime),
-                    entry_low,
-                    entry_high,
-                    signal.stop_loss,
-                    tp1,
-                    tp2,
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        created_at = int(datetime.utcnow().timestamp())
+        rows = [_signal_row(signal, created_at) for signal in signals]
+        self._enqueue_writes(_INSERT_SIGNAL_SQL, rows)
 
     def get_recent_signals(self, limit: int = 20) -> list[dict]:
         """Return the most recent logged signals ordered newest first."""
 
-        conn = self._connect()
-        try:
-            cursor = conn.execute(
-                """
-                SELECT
-                    id, created_at, symbol, timeframe, action, strategy_name,
-                    risk_rating, confidence_score, regime
-                FROM signals
-                ORDER BY created_at DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
+        # Include signals logged but not yet written
+        self.flush()
+        with self._read() as conn:
+            cursor = conn.execute(_SELECT_RECENT_SIGNALS_SQL, (limit,))
             rows = cursor.fetchall()
             return [
                 {
@@ -317,10 +646,11 @@ class DataRepository:
                     "action": row[4],
                     "strategy_name": row[5],
                     "risk_rating": row[6],
-                    "confidence_score": row[7],
+                    "confidence_score": float(row[7]),
                     "regime": row[8],
                 }
                 for row in rows
             ]
-        finally:
-            conn.close()
+
+
+__all__ = ["DataRepository"]
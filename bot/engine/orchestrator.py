@@ -1,36 +1,51 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from bot.data.client import ExchangeClient
-from bot.indicators.core import add_basic_indicators
+from bot.indicators.core import (
+    add_basic_indicators,
+    add_basic_indicators_batch_cached,
+    add_basic_indicators_cached,
+)
 from bot.engine.regime import detect_regime
 from bot.models import TradeSignal, TradeAction, RiskRating, MarketRegime
+from bot.strategy.base import BaseStrategy, SignalContext
 from bot.strategy.registry import get_strategy_registry
 
 
+# Symbols sharing a strategy in one scan before it is run through its
+# vectorized batch path instead of symbol by symbol
+BATCH_MIN_SYMBOLS = 8
+
+
 def _mock_uptrend_df(n: int = 200) -> pd.DataFrame:
     """
     Create a synthetic strong uptrend dataset for demo/testing.
 
     Used when use_mock=True so demo mode always has a clean uptrend.
     """
-    now = datetime.utcnow()
     # 5-minute candles going back n steps
-    ts = [now - timedelta(minutes=5 * (n - i)) for i in range(n)]
-    close = [100 + i * 0.5 for i in range(n)]
+    ts = pd.date_range(
+        end=datetime.utcnow() - timedelta(minutes=5), periods=n, freq="5min"
+    )
+    close = 100 + np.arange(n, dtype=np.float64) * 0.5
 
     df = pd.DataFrame(
         {
             "timestamp": ts,
             "open": close,
-            "high": [c * 1.01 for c in close],
-            "low": [c * 0.99 for c in close],
+            "high": close * 1.01,
+            "low": close * 0.99,
             "close": close,
-            "volume": [1000.0] * n,
+            "volume": np.full(n, 1000.0),
         }
     )
     df = add_basic_indicators(df)
@@ -38,11 +53,46 @@ def _mock_uptrend_df(n: int = 200) -> pd.DataFrame:
     return df
 
 
+@lru_cache(maxsize=64)
+def _filter_strategies(
+    regime: MarketRegime,
+    enabled: Optional[Tuple[str, ...]],
+) -> Tuple[BaseStrategy, ...]:
+    """
+    Registered strategies for regime, limited to the enabled names if given.
+
+    The registry is fixed at import time, so each (regime, enabled) pair is
+    only filtered once. `enabled` is a sorted tuple so it can be a cache key.
+    """
+    strategies = get_strategy_registry().get(regime, ())
+    if enabled:
+        enabled_set = set(enabled)
+        strategies = [s for s in strategies if getattr(s, "name", "") in enabled_set]
+    return tuple(strategies)
+
+
 class SignalEngine:
     """High level engine that generates final trade signals."""
 
     def __init__(self, exchange_client: Optional[ExchangeClient] = None) -> None:
         self.exchange_client = exchange_client or ExchangeClient()
+        # Shared by every call for strategy and per symbol fan-out; threads are
+        # only started once there is more than one unit of work.
+        self._strategy_pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1)
+        )
+
+    def _fetch_candles(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        df = self.exchange_client.get_recent_candles(
+            symbol=symbol,
+            timeframe=timeframe,
+            limit=limit,
+        )
+        print(
+            f"[SignalEngine] Fetched {len(df)} candles for {symbol} {timeframe} "
+            f"(requested {limit})"
+        )
+        return df
 
     def generate_signal(
         self,
@@ -64,21 +114,161 @@ class SignalEngine:
             df = _mock_uptrend_df(limit)
             print(f"[SignalEngine] Using MOCK data for demo: {len(df)} candles")
         else:
-            df = self.exchange_client.get_recent_candles(
-                symbol=symbol,
-                timeframe=timeframe,
-                limit=limit,
-            )
-            print(
-                f"[SignalEngine] Fetched {len(df)} candles for {symbol} {timeframe} "
-                f"(requested {limit})"
-            )
-
+            df = self._fetch_candles(symbol, timeframe, limit)
             if df.empty:
                 print("[SignalEngine] No candles returned from exchange")
                 return None
+            # Shared with /candles: the same window is only computed once
+            df = add_basic_indicators_cached(df, symbol, timeframe)
+
+        return self._signal_from_indicators(
+            df, symbol, timeframe, use_mock, enabled_strategies
+        )
+
+    def generate_signals_batch(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        limit: int = 400,
+        use_mock: bool = False,
+        enabled_strategies: List[str] | None = None,
+    ) -> List[Optional[TradeSignal]]:
+        """
+        Run generate_signal for many symbols on the same timeframe.
+
+        Candles are fetched concurrently and indicators for all symbols are
+        computed in one batch. Signals are returned in the order of `symbols`.
+        Failures are re-raised as RuntimeError prefixed with the symbol.
+        """
+        if use_mock:
+            df = _mock_uptrend_df(limit)
+            print(f"[SignalEngine] Using MOCK data for demo: {len(df)} candles")
+            return [
+                self._signal_from_indicators(
+                    df, symbol, timeframe, use_mock, enabled_strategies
+                )
+                for symbol in symbols
+            ]
+
+        # 1) Data: blocking exchange I/O, so fetch every symbol concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(len(symbols), 20))) as pool:
+            futures = [
+                pool.submit(self._fetch_candles, symbol, timeframe, limit)
+                for symbol in symbols
+            ]
+            raw_frames: List[pd.DataFrame] = []
+            for symbol, future in zip(symbols, futures):
+                try:
+                    raw_frames.append(future.result())
+                except Exception as exc:
+                    raise RuntimeError(f"{symbol}: {exc}") from exc
+
+        non_empty = [pos for pos, df in enumerate(raw_frames) if not df.empty]
+        with_indicators = add_basic_indicators_batch_cached(
+            [raw_frames[pos] for pos in non_empty],
+            [symbols[pos] for pos in non_empty],
+            timeframe,
+        )
+        frames: List[Optional[pd.DataFrame]] = [None] * len(symbols)
+        for pos, df in zip(non_empty, with_indicators):
+            frames[pos] = df
+
+        # 2) Regime and strategy selection, symbols side by side
+        def prepare(pos: int):
+            try:
+                return self._prepare_symbol(
+                    frames[pos], symbols[pos], timeframe, use_mock, enabled_strategies
+                )
+            except Exception as exc:
+                raise RuntimeError(f"{symbols[pos]}: {exc}") from exc
+
+        signals: List[Optional[TradeSignal]] = [None] * len(symbols)
+        for pos, df in enumerate(frames):
+            if df is None:
+                print(
+                    f"[SignalEngine] No candles returned from exchange for {symbols[pos]}"
+                )
+        available = [pos for pos, df in enumerate(frames) if df is not None]
+        prepared = {
+            pos: result
+            for pos, result in zip(available, self._map(prepare, available))
+            if result is not None
+        }
+
+        # 3) Each strategy once over every symbol that selected it
+        by_strategy: Dict[BaseStrategy, List[int]] = {}
+        for pos, (_, _, strategies, _) in prepared.items():
+            for strat in strategies:
+                by_strategy.setdefault(strat, []).append(pos)
+
+        results: Dict[Tuple[int, BaseStrategy], Optional[TradeSignal]] = {}
+        for strat, positions in by_strategy.items():
+            batch = self._run_strategy_batch(
+                strat,
+                [prepared[pos][0] for pos in positions],
+                [symbols[pos] for pos in positions],
+                timeframe,
+                [prepared[pos][1] for pos in positions],
+                [prepared[pos][3] for pos in positions],
+            )
+            for pos, sig in zip(positions, batch):
+                results[pos, strat] = sig
+
+        for pos, (df, _, strategies, _) in prepared.items():
+            try:
+                signals[pos] = self._best_signal(
+                    [results[pos, strat] for strat in strategies],
+                    df,
+                    symbols[pos],
+                    timeframe,
+                    use_mock,
+                )
+            except Exception as exc:
+                raise RuntimeError(f"{symbols[pos]}: {exc}") from exc
+        return signals
+
+    def _signal_from_indicators(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        use_mock: bool,
+        enabled_strategies: List[str] | None,
+    ) -> Optional[TradeSignal]:
+        """Regime detection, strategy selection and demo fallback for one symbol."""
+        prepared = self._prepare_symbol(
+            df, symbol, timeframe, use_mock, enabled_strategies
+        )
+        if prepared is None:
+            return None
+        df, regime, strategies, ctx = prepared
+
+        # Strategies are independent and spend their time in numpy/pandas, so
+        # several of them run side by side, sharing one set of numpy columns
+        results = self._map(
+            lambda strat: self._run_strategy(strat, df, symbol, timeframe, regime, ctx),
+            list(strategies),
+        )
 
-            df = add_basic_indicators(df)
+        return self._best_signal(results, df, symbol, timeframe, use_mock)
+
+    def _prepare_symbol(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        use_mock: bool,
+        enabled_strategies: List[str] | None,
+    ) -> Optional[
+        Tuple[pd.DataFrame, MarketRegime, Tuple[BaseStrategy, ...], SignalContext]
+    ]:
+        """
+        Warmup trim, regime and strategy selection; None without enough history.
+
+        The returned SignalContext already holds the columns regime detection
+        read, for the strategies to reuse.
+        """
+        if not use_mock:
             print(
                 f"[SignalEngine] After indicators (before dropna): {len(df)} rows"
             )
@@ -94,20 +284,18 @@ class SignalEngine:
                 return None
 
         # 2) Regime
+        ctx = SignalContext(df)
         if use_mock:
             regime = MarketRegime.TREND_UP
         else:
-            regime = detect_regime(df)
+            regime = detect_regime(df, ctx)
         print(f"[SignalEngine] Regime for {symbol} {timeframe}: {regime}")
 
         # 3) Strategies for this regime
-        registry = get_strategy_registry()
-        strategies = registry.get(regime, [])
-        if enabled_strategies:
-            enabled_set = set(enabled_strategies)
-            strategies = [
-                s for s in strategies if getattr(s, "name", "") in enabled_set
-            ]
+        strategies = _filter_strategies(
+            regime,
+            tuple(sorted(set(enabled_strategies))) if enabled_strategies else None,
+        )
         if not strategies:
             print(
                 f"[SignalEngine] No strategies mapped for regime={regime} with enabled filter={enabled_strategies}"
@@ -119,25 +307,21 @@ class SignalEngine:
             [getattr(s, "name", s.__class__.__name__) for s in strategies],
         )
 
-        best_signal: Optional[TradeSignal] = None
-
-        for strat in strategies:
-            name = getattr(strat, "name", strat.__class__.__name__)
-            try:
-                sig = strat.generate_signal(df, symbol, timeframe, regime)
-            except Exception as exc:  # keep engine alive even if one strategy bugs
-                print(f"[SignalEngine] Strategy {name} raised: {exc!r}")
-                continue
+        return df, regime, strategies, ctx
 
+    def _best_signal(
+        self,
+        results: List[Optional[TradeSignal]],
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        use_mock: bool,
+    ) -> Optional[TradeSignal]:
+        """Highest confidence strategy signal, or the demo BUY in mock mode."""
+        best_signal: Optional[TradeSignal] = None
+        for sig in results:
             if sig is None:
-                print(f"[SignalEngine] Strategy {name} -> None")
                 continue
-
-            print(
-                f"[SignalEngine] Strategy {name} -> action={sig.action} "
-                f"conf={sig.confidence_score}"
-            )
-
             if best_signal is None or sig.confidence_score > best_signal.confidence_score:
                 best_signal = sig
 
@@ -178,3 +362,73 @@ class SignalEngine:
             )
 
         return best_signal
+
+    @staticmethod
+    def _run_strategy(
+        strat: BaseStrategy,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        regime: MarketRegime,
+        ctx: SignalContext,
+    ) -> Optional[TradeSignal]:
+        """Run one strategy, logging its outcome; errors count as no signal."""
+        name = getattr(strat, "name", strat.__class__.__name__)
+        try:
+            sig = strat.generate_signal(df, symbol, timeframe, regime, ctx=ctx)
+        except Exception as exc:  # keep engine alive even if one strategy bugs
+            print(f"[SignalEngine] Strategy {name} raised: {exc!r}")
+            return None
+
+        if sig is None:
+            print(f"[SignalEngine] Strategy {name} -> None")
+            return None
+
+        print(
+            f"[SignalEngine] Strategy {name} -> action={sig.action} "
+            f"conf={sig.confidence_score}"
+        )
+        return sig
+
+    def _run_strategy_batch(
+        self,
+        strat: BaseStrategy,
+        frames: List[pd.DataFrame],
+        symbols: List[str],
+        timeframe: str,
+        regimes: List[MarketRegime],
+        contexts: List[SignalContext],
+    ) -> List[Optional[TradeSignal]]:
+        """
+        One strategy over several symbols.
+
+        From BATCH_MIN_SYMBOLS symbols on, the strategy's batch path gates them
+        all at once; below that, or if the batch path fails, symbols run one
+        at a time.
+        """
+        if len(frames) >= BATCH_MIN_SYMBOLS:
+            name = getattr(strat, "name", strat.__class__.__name__)
+            try:
+                batch = strat.generate_signals_batch(
+                    frames, symbols, timeframe, regimes, contexts
+                )
+            except Exception as exc:  # fall back to the per symbol path
+                print(f"[SignalEngine] Strategy {name} batch raised: {exc!r}")
+            else:
+                print(
+                    f"[SignalEngine] Strategy {name} over {len(frames)} symbols -> "
+                    f"{sum(sig is not None for sig in batch)} signals"
+                )
+                return batch
+
+        jobs = list(zip(frames, symbols, regimes, contexts))
+        return self._map(
+            lambda job: self._run_strategy(strat, job[0], job[1], timeframe, job[2], job[3]),
+            jobs,
+        )
+
+    def _map(self, func, items: List) -> List:
+        """func over items on the shared pool, or inline for a single item."""
+        if len(items) > 1:
+            return list(self._strategy_pool.map(func, items))
+        return [func(item) for item in items]
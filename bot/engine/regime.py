@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
-from bot.indicators.features import compute_trend_direction
+from bot.indicators.context import SignalContext
+from bot.indicators.features import compute_trend_direction, compute_trend_directions
 from bot.models import MarketRegime
 
 
-def detect_regime(df: pd.DataFrame) -> MarketRegime:
+def detect_regime(
+    df: pd.DataFrame,
+    ctx: Optional[SignalContext] = None,
+) -> MarketRegime:
     """
     Detect the current market regime using indicators and features.
 
     This function can be extended later.
     """
-    regime = compute_trend_direction(df)
+    regime = compute_trend_direction(df, ctx)
     return regime
+
+
+def detect_regimes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Detect the regime at every bar, as detect_regime would on each prefix.
+
+    Used by the backtester so it does not re-run detection on a growing slice.
+    """
+    return compute_trend_directions(df)
@@ -31,15 +31,12 @@ def calculate_position_sizing(payload: PositionSizingRequest) -> PositionSizingR
 
     position_size = risk_amount / per_unit_risk if per_unit_risk > 0 else 0.0
 
-    r_to_tp: List[float] = []
-    if payload.take_profits:
-        for tp in payload.take_profits:
-            if payload.entry_price >= payload.stop_loss:
-                reward = tp - payload.entry_price
-            else:
-                reward = payload.entry_price - tp
-            r_multiple = reward / per_unit_risk
-            r_to_tp.append(r_multiple)
+    # Long when the stop is below entry, short otherwise; decided once, not per target
+    sign = 1.0 if payload.entry_price >= payload.stop_loss else -1.0
+    r_to_tp: List[float] = [
+        sign * (tp - payload.entry_price) / per_unit_risk
+        for tp in payload.take_profits or []
+    ]
 
     return PositionSizingResponse(
         account_size=payload.account_size,
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+
+class SignalContext:
+    """
+    float64 numpy columns of one candle frame, shared by regime detection and
+    every strategy evaluated on it.
+
+    Each column is pulled out of the DataFrame the first time it is read and
+    reused after that. Columns stay separate 1-D arrays; a single 2-D
+    to_numpy() of the frame would copy every column into one block.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.df.columns
+
+    def column(self, name: str) -> np.ndarray:
+        values = self._columns.get(name)
+        if values is None:
+            values = self.df[name].to_numpy(dtype="float64")
+            self._columns[name] = values
+        return values
+
+    @property
+    def close_np(self) -> np.ndarray:
+        return self.column("close")
+
+    @property
+    def high_np(self) -> np.ndarray:
+        return self.column("high")
+
+    @property
+    def low_np(self) -> np.ndarray:
+        return self.column("low")
+
+    @property
+    def ema20_np(self) -> np.ndarray:
+        return self.column("ema20")
+
+    @property
+    def ema50_np(self) -> np.ndarray:
+        return self.column("ema50")
+
+    @property
+    def ema200_np(self) -> np.ndarray:
+        return self.column("ema200")
+
+    @property
+    def rsi14_np(self) -> np.ndarray:
+        return self.column("rsi14")
+
+
+__all__ = ["SignalContext"]
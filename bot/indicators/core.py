@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
 import pandas as pd
-from ta.trend import EMAIndicator, MACD
-from ta.momentum import RSIIndicator
-from ta.volatility import BollingerBands
+from cachetools import LRUCache
+
+from bot.indicators.kernels import basic_indicator_arrays, range_indicator_arrays
+from bot.jit import NUMBA_AVAILABLE
 
 
 def add_basic_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -11,35 +16,263 @@ def add_basic_indicators(df: pd.DataFrame) -> pd.DataFrame:
     Add common indicators to the DataFrame.
 
     Assumes columns: ['open', 'high', 'low', 'close', 'volume'].
+    The input frame is left untouched. Indicator columns are float64: the
+    strategies gate on fixed thresholds, and the live, batch and backtest paths
+    have to agree on every bar, which float32 rounding would break.
+    """
+    close_values = df["close"].to_numpy(dtype="float64")
+    high_values = df["high"].to_numpy(dtype="float64")
+    low_values = df["low"].to_numpy(dtype="float64")
+
+    # JIT compiled kernels when numba is installed, pandas ewm/rolling otherwise
+    if NUMBA_AVAILABLE:
+        columns = basic_indicator_arrays(close_values)
+        columns.update(range_indicator_arrays(high_values, low_values, close_values))
+        return _with_columns(df, columns)
+
+    columns = _indicator_arrays(close_values)
+    ranges = _range_indicator_columns(
+        pd.Series(high_values, copy=False),
+        pd.Series(low_values, copy=False),
+        pd.Series(close_values, copy=False),
+    )
+    columns.update({name: series.to_numpy() for name, series in ranges.items()})
+    return _with_columns(df, columns)
+
+
+def _with_columns(df: pd.DataFrame, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
     """
-    df = df.copy()
+    Return df with the given columns added or replaced.
 
-    close = df["close"]
+    One concat instead of a copy plus one insert per column; under
+    copy-on-write the existing columns are shared, not copied.
+    """
+    existing = [name for name in columns if name in df.columns]
+    if existing:
+        df = df.drop(columns=existing)
+    return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
+
+
+def _indicator_arrays(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    basic_indicator_arrays without numba, on pandas' C ewm/rolling loops.
 
-    # EMAs
-    df["ema20"] = EMAIndicator(close=close, window=20).ema_indicator()
-    df["ema50"] = EMAIndicator(close=close, window=50).ema_indicator()
-    df["ema200"] = EMAIndicator(close=close, window=200).ema_indicator()
+    Formulas match the ta library's EMA, RSI, MACD and Bollinger Bands
+    indicators.
+    """
+    series = pd.Series(close, copy=False)
+
+    def ema(values: pd.Series, span: int) -> np.ndarray:
+        return values.ewm(span=span, min_periods=span, adjust=False).mean().to_numpy()
 
-    # RSI
-    df["rsi14"] = RSIIndicator(close=close, window=14).rsi()
+    # Wilder RSI
+    diff = np.diff(close, prepend=np.nan)
+    up = pd.Series(np.where(diff > 0, diff, 0.0))
+    down = pd.Series(np.where(diff < 0, -diff, 0.0))
+    avg_up = up.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean().to_numpy()
+    avg_down = down.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean().to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_down == 0, 100.0, 100 - 100 / (1 + avg_up / avg_down))
 
     # MACD
-    macd = MACD(
-        close=close,
-        window_slow=26,
-        window_fast=12,
-        window_sign=9,
+    macd = ema(series, 12) - ema(series, 26)
+    macd_signal = ema(pd.Series(macd), 9)
+
+    # Bollinger Bands
+    rolling = series.rolling(20, min_periods=20)
+    bb_mid = rolling.mean().to_numpy()
+    bb_std = rolling.std(ddof=0).to_numpy()
+    bb_high = bb_mid + 2 * bb_std
+    bb_low = bb_mid - 2 * bb_std
+
+    return {
+        "ema20": ema(series, 20),
+        "ema50": ema(series, 50),
+        "ema200": ema(series, 200),
+        "rsi14": rsi,
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd - macd_signal,
+        "bb_high": bb_high,
+        "bb_low": bb_low,
+        "bb_mid": bb_mid,
+        "bb_width": bb_high - bb_low,
+    }
+
+
+def _range_indicator_columns(high, low, close) -> Dict:
+    """
+    ATR and 50 bar range columns read by the strategies.
+
+    Takes Series, or wide DataFrames with one column per frame. atr14 is the
+    rolling 14 bar mean of the true range; the first bar has no previous close,
+    so its true range is high - low. The 50 bar columns use whatever history
+    there is before bar 50, like tail(50).
+    """
+    prev_close = close.shift(1)
+    true_range = np.fmax(
+        np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs()
+    )
+    return {
+        "atr14": true_range.rolling(14).mean(),
+        "range_high50": high.rolling(50, min_periods=1).max(),
+        "range_low50": low.rolling(50, min_periods=1).min(),
+        "close_mean50": close.rolling(50, min_periods=1).mean(),
+    }
+
+
+def _wide_indicator_columns(close: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Compute the add_basic_indicators columns for a wide frame of closes.
+
+    Each column of `close` is one series, so every ewm/rolling call below runs
+    once over all of them. Same formulas as _indicator_arrays.
+    """
+
+    def ema(values: pd.DataFrame, span: int) -> pd.DataFrame:
+        return values.ewm(span=span, min_periods=span, adjust=False).mean()
+
+    columns: Dict[str, pd.DataFrame] = {
+        "ema20": ema(close, 20),
+        "ema50": ema(close, 50),
+        "ema200": ema(close, 200),
+    }
+
+    # Wilder RSI
+    diff = close.diff(1)
+    up = diff.where(diff > 0, 0.0)
+    down = -diff.where(diff < 0, 0.0)
+    avg_up = up.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    avg_down = down.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    columns["rsi14"] = pd.DataFrame(
+        np.where(avg_down == 0, 100, 100 - (100 / (1 + avg_up / avg_down))),
+        index=close.index,
+        columns=close.columns,
     )
-    df["macd"] = macd.macd()
-    df["macd_signal"] = macd.macd_signal()
-    df["macd_hist"] = macd.macd_diff()
+
+    # MACD
+    macd = ema(close, 12) - ema(close, 26)
+    macd_signal = ema(macd, 9)
+    columns["macd"] = macd
+    columns["macd_signal"] = macd_signal
+    columns["macd_hist"] = macd - macd_signal
 
     # Bollinger Bands
-    bb = BollingerBands(close=close, window=20, window_dev=2)
-    df["bb_high"] = bb.bollinger_hband()
-    df["bb_low"] = bb.bollinger_lband()
-    df["bb_mid"] = bb.bollinger_mavg()
-    df["bb_width"] = df["bb_high"] - df["bb_low"]
+    rolling = close.rolling(20, min_periods=20)
+    bb_mid = rolling.mean()
+    bb_std = rolling.std(ddof=0)
+    columns["bb_high"] = bb_mid + 2 * bb_std
+    columns["bb_low"] = bb_mid - 2 * bb_std
+    columns["bb_mid"] = bb_mid
+    columns["bb_width"] = columns["bb_high"] - columns["bb_low"]
+
+    return columns
+
+
+def add_basic_indicators_batch(frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """
+    Add the basic indicators to many candle DataFrames at once.
+
+    Frames of equal length are stacked side by side so each indicator is a
+    single pandas call over all of them instead of one call per frame.
+    Results are returned in input order.
+    """
+    groups: Dict[int, List[int]] = {}
+    for pos, df in enumerate(frames):
+        groups.setdefault(len(df), []).append(pos)
+
+    results: List[pd.DataFrame] = list(frames)
+    for positions in groups.values():
+        def stacked(name: str) -> pd.DataFrame:
+            return pd.DataFrame(
+                {pos: frames[pos][name].to_numpy(dtype="float64") for pos in positions}
+            )
+
+        close = stacked("close")
+        columns = _wide_indicator_columns(close)
+        columns.update(_range_indicator_columns(stacked("high"), stacked("low"), close))
+        for pos in positions:
+            results[pos] = _with_columns(
+                frames[pos],
+                {name: wide[pos].to_numpy() for name, wide in columns.items()},
+            )
+
+    return results
+
+
+_INDICATOR_CACHE: LRUCache = LRUCache(maxsize=2048)
+_INDICATOR_CACHE_LOCK = threading.Lock()
+
+
+def _indicator_cache_key(df: pd.DataFrame, symbol: str, timeframe: str) -> tuple:
+    """
+    Identify a window of exchange candles.
+
+    Closed bars never change, so the window is identified by its bounds and
+    length plus the values of the last (possibly still forming) bar.
+    """
+    last = df.iloc[-1]
+    return (
+        symbol,
+        timeframe,
+        len(df),
+        df["timestamp"].iloc[0].value,
+        df["timestamp"].iloc[-1].value,
+        float(last["open"]),
+        float(last["high"]),
+        float(last["low"]),
+        float(last["close"]),
+        float(last["volume"]),
+    )
+
+
+def add_basic_indicators_cached(
+    df: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+) -> pd.DataFrame:
+    """
+    Memoized add_basic_indicators for a window of exchange candles.
+
+    The returned frame is shared between callers and must not be mutated.
+    """
+    key = _indicator_cache_key(df, symbol, timeframe)
+    with _INDICATOR_CACHE_LOCK:
+        cached = _INDICATOR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = add_basic_indicators(df)
+    with _INDICATOR_CACHE_LOCK:
+        _INDICATOR_CACHE[key] = result
+    return result
+
+
+def add_basic_indicators_batch_cached(
+    frames: List[pd.DataFrame],
+    symbols: List[str],
+    timeframe: str,
+) -> List[pd.DataFrame]:
+    """
+    add_basic_indicators_batch that reuses and fills the indicator cache.
+
+    Windows already computed (by this or add_basic_indicators_cached) are
+    reused; the rest are computed in one batch. Returned frames are shared
+    between callers and must not be mutated.
+    """
+    keys = [
+        _indicator_cache_key(df, symbol, timeframe)
+        for df, symbol in zip(frames, symbols)
+    ]
+    with _INDICATOR_CACHE_LOCK:
+        results: List[Optional[pd.DataFrame]] = [
+            _INDICATOR_CACHE.get(key) for key in keys
+        ]
 
-    return df
+    missing = [pos for pos, result in enumerate(results) if result is None]
+    computed = add_basic_indicators_batch([frames[pos] for pos in missing])
+    with _INDICATOR_CACHE_LOCK:
+        for pos, result in zip(missing, computed):
+            _INDICATOR_CACHE[keys[pos]] = result
+            results[pos] = result
+    return results
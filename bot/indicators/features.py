@@ -1,26 +1,33 @@
 from __future__ import annotations
 
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from bot.indicators.context import SignalContext
 from bot.models import MarketRegime
 
 
-def _ema_slope(series: pd.Series, window: int = 15) -> float:
+def _ema_slope(values: np.ndarray, window: int = 15) -> float:
     """Return simple percentage slope over the provided window."""
 
-    tail = series.tail(window)
-    if len(tail) < 2:
+    if len(values) < 2:
         return 0.0
 
-    start = float(tail.iloc[0])
-    end = float(tail.iloc[-1])
+    # Shorter histories use everything there is, like Series.tail(window)
+    start = float(values[-min(window, len(values))])
+    end = float(values[-1])
     if start == 0:
         return 0.0
 
     return (end - start) / start
 
 
-def compute_trend_direction(df: pd.DataFrame) -> MarketRegime:
+def compute_trend_direction(
+    df: pd.DataFrame,
+    ctx: Optional[SignalContext] = None,
+) -> MarketRegime:
     """
     Detect market regime using EMA stacking plus recent slopes.
 
@@ -28,17 +35,24 @@ def compute_trend_direction(df: pd.DataFrame) -> MarketRegime:
     Downtrend: EMAs stacked downward with negative slope.
     Range: flat-ish EMAs with compressed price range.
     Otherwise: choppy/unknown.
+
+    ctx, when given, is a SignalContext for df that the strategies run on the
+    same frame reuse afterwards.
     """
 
-    recent = df.tail(120) if len(df) > 120 else df
-    last = recent.iloc[-1]
-    ema20 = float(last["ema20"])
-    ema50 = float(last["ema50"])
-    ema200 = float(last.get("ema200", ema50))
-    close = float(last["close"])
+    # Each column comes out of the frame once; the latest values are plain
+    # floats from there
+    ctx = ctx or SignalContext(df)
+    close_values = ctx.close_np[-120:]
+    ema20_values = ctx.ema20_np[-120:]
+    ema50_values = ctx.ema50_np[-120:]
+    ema20 = float(ema20_values[-1])
+    ema50 = float(ema50_values[-1])
+    ema200 = float(ctx.ema200_np[-1]) if "ema200" in ctx else ema50
+    close = float(close_values[-1])
 
-    ema20_slope = _ema_slope(recent["ema20"], window=25)
-    ema50_slope = _ema_slope(recent["ema50"], window=35)
+    ema20_slope = _ema_slope(ema20_values, window=25)
+    ema50_slope = _ema_slope(ema50_values, window=35)
 
     stacked_up = ema20 > ema50 > ema200
     stacked_down = ema20 < ema50 < ema200
@@ -51,9 +65,11 @@ def compute_trend_direction(df: pd.DataFrame) -> MarketRegime:
         return MarketRegime.TREND_DOWN
 
     # Range detection: small slopes + compressed prices around EMA50
-    recent_closes = recent["close"].tail(60)
+    recent_closes = close_values[-60:]
     if len(recent_closes) >= 20:
-        pct_range = (recent_closes.max() - recent_closes.min()) / max(recent_closes.mean(), 1e-9)
+        pct_range = (np.nanmax(recent_closes) - np.nanmin(recent_closes)) / max(
+            np.nanmean(recent_closes), 1e-9
+        )
         close_to_ema = abs(close - ema50) / max(ema50, 1e-9)
         if abs(ema20_slope) < 0.001 and abs(ema50_slope) < 0.0008 and pct_range < 0.05 and close_to_ema < 0.02:
             return MarketRegime.RANGE
@@ -61,6 +77,71 @@ def compute_trend_direction(df: pd.DataFrame) -> MarketRegime:
     return MarketRegime.CHOPPY
 
 
+# MarketRegime is a str enum, so index an object array instead of letting
+# numpy coerce the members to strings.
+_REGIME_BY_CODE = np.array(
+    [MarketRegime.TREND_UP, MarketRegime.TREND_DOWN, MarketRegime.RANGE, MarketRegime.CHOPPY],
+    dtype=object,
+)
+
+
+def _trailing_slopes(values: np.ndarray, window: int) -> np.ndarray:
+    """_ema_slope evaluated at every bar over the window ending at that bar."""
+
+    positions = np.arange(len(values))
+    start = values[np.maximum(positions - (window - 1), 0)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = (values - start) / start
+    slopes[(positions < 1) | (start == 0)] = 0.0
+    return slopes
+
+
+def compute_trend_directions(df: pd.DataFrame) -> np.ndarray:
+    """
+    compute_trend_direction for every bar at once.
+
+    Element i is the regime compute_trend_direction returns for df.iloc[: i + 1],
+    computed column-wise in one pass. Returns an object array of MarketRegime.
+    """
+
+    close = df["close"].to_numpy(dtype="float64")
+    ema20 = df["ema20"].to_numpy(dtype="float64")
+    ema50 = df["ema50"].to_numpy(dtype="float64")
+    ema200 = df["ema200"].to_numpy(dtype="float64") if "ema200" in df.columns else ema50
+
+    # The 120 bar "recent" window is longer than every lookback below, so each
+    # lookback is simply the trailing window ending at the bar.
+    ema20_slope = _trailing_slopes(ema20, 25)
+    ema50_slope = _trailing_slopes(ema50, 35)
+
+    stacked_up = (ema20 > ema50) & (ema50 > ema200)
+    stacked_down = (ema20 < ema50) & (ema50 < ema200)
+
+    trend_up = (
+        stacked_up & (ema20_slope > 0.0015) & (ema50_slope > 0.0005) & (close > ema20)
+    )
+    trend_down = (
+        stacked_down & (ema20_slope < -0.0015) & (ema50_slope < -0.0005) & (close < ema20)
+    )
+
+    closes = df["close"].astype("float64").rolling(60, min_periods=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_range = (closes.max() - closes.min()).to_numpy() / np.maximum(
+            closes.mean().to_numpy(), 1e-9
+        )
+        close_to_ema = np.abs(close - ema50) / np.maximum(ema50, 1e-9)
+    in_range = (
+        (np.arange(len(df)) >= 19)
+        & (np.abs(ema20_slope) < 0.001)
+        & (np.abs(ema50_slope) < 0.0008)
+        & (pct_range < 0.05)
+        & (close_to_ema < 0.02)
+    )
+
+    codes = np.select([trend_up, trend_down, in_range], [0, 1, 2], default=3)
+    return _REGIME_BY_CODE[codes]
+
+
 def compute_volatility_regime(df: pd.DataFrame) -> str:
     """
     Classify volatility as 'low', 'medium', or 'high'.
@@ -79,3 +160,10 @@ def compute_volatility_regime(df: pd.DataFrame) -> str:
     if rel_width < 0.05:
         return "medium"
     return "high"
+
+
+__all__ = [
+    "compute_trend_direction",
+    "compute_trend_directions",
+    "compute_volatility_regime",
+]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from typing import Dict
+
+import numpy as np
+
+from bot.jit import njit
+
+
+@njit(cache=True)
+def ewm_mean(values: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """
+    Exponentially weighted mean, same as pandas ewm(alpha, adjust=False).mean().
+
+    Leading NaNs are skipped and NaN gaps decay the previous weight, exactly
+    like pandas with ignore_na=False.
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    old_wt_factor = 1.0 - alpha
+    old_wt = 1.0
+    weighted = np.nan
+    nobs = 0
+    for i in range(n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
+
+
+@njit(cache=True)
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """EMA with the first value after `span` observations, as in ta's EMAIndicator."""
+    return ewm_mean(values, 2.0 / (span + 1.0), span)
+
+
+@njit(cache=True)
+def wilder_rsi(close: np.ndarray, window: int) -> np.ndarray:
+    """Wilder RSI as computed by ta's RSIIndicator."""
+    n = close.shape[0]
+    up = np.zeros(n)
+    down = np.zeros(n)
+    for i in range(1, n):
+        diff = close[i] - close[i - 1]
+        if diff > 0:
+            up[i] = diff
+        elif diff < 0:
+            down[i] = -diff
+    avg_up = ewm_mean(up, 1.0 / window, window)
+    avg_down = ewm_mean(down, 1.0 / window, window)
+    out = np.empty(n)
+    for i in range(n):
+        if avg_down[i] == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_up[i] / avg_down[i])
+    return out
+
+
+@njit(cache=True)
+def macd(close: np.ndarray, fast: int, slow: int, sign: int):
+    """MACD line, signal and histogram as computed by ta's MACD."""
+    line = ema(close, fast) - ema(close, slow)
+    signal = ema(line, sign)
+    return line, signal, line - signal
+
+
+@njit(cache=True)
+def rolling_mean_std(values: np.ndarray, window: int):
+    """Rolling mean and population std (ddof=0), NaN until the window is full."""
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        total = 0.0
+        for j in range(i - window + 1, i + 1):
+            total += values[j]
+        mu = total / window
+        sq = 0.0
+        for j in range(i - window + 1, i + 1):
+            sq += (values[j] - mu) ** 2
+        mean[i] = mu
+        std[i] = np.sqrt(sq / window)
+    return mean, std
+
+
+@njit(cache=True)
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True range per bar; the first bar has no previous close, so it is high - low.
+
+    NaN inputs are skipped like DataFrame.max(axis=1).
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            up = abs(high[i] - prev_close)
+            down = abs(low[i] - prev_close)
+            if up > tr or tr != tr:
+                tr = up
+            if down > tr or tr != tr:
+                tr = down
+        out[i] = tr
+    return out
+
+
+@njit(cache=True)
+def rolling_mean(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling mean over the non-NaN values, NaN below min_periods of them."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(n):
+        total = 0.0
+        count = 0
+        for j in range(max(0, i - window + 1), i + 1):
+            if values[j] == values[j]:
+                total += values[j]
+                count += 1
+        if count >= min_periods and count > 0:
+            out[i] = total / count
+    return out
+
+
+@njit(cache=True)
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling max skipping NaN, over whatever history there is (min_periods=1)."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(n):
+        best = np.nan
+        for j in range(max(0, i - window + 1), i + 1):
+            if values[j] > best or best != best:
+                best = values[j]
+        out[i] = best
+    return out
+
+
+@njit(cache=True)
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling min skipping NaN, over whatever history there is (min_periods=1)."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(n):
+        best = np.nan
+        for j in range(max(0, i - window + 1), i + 1):
+            if values[j] < best or best != best:
+                best = values[j]
+        out[i] = best
+    return out
+
+
+def range_indicator_arrays(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Compute the ATR and 50 bar range columns from float64 high/low/close arrays."""
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+
+    return {
+        "atr14": rolling_mean(true_range(high, low, close), 14, 14),
+        "range_high50": rolling_max(high, 50),
+        "range_low50": rolling_min(low, 50),
+        "close_mean50": rolling_mean(close, 50, 1),
+    }
+
+
+def basic_indicator_arrays(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute the add_basic_indicators columns from a float64 close array."""
+    close = np.ascontiguousarray(close, dtype=np.float64)
+
+    macd_line, macd_signal, macd_hist = macd(close, 12, 26, 9)
+    bb_mid, bb_std = rolling_mean_std(close, 20)
+    bb_high = bb_mid + 2 * bb_std
+    bb_low = bb_mid - 2 * bb_std
+
+    return {
+        "ema20": ema(close, 20),
+        "ema50": ema(close, 50),
+        "ema200": ema(close, 200),
+        "rsi14": wilder_rsi(close, 14),
+        "macd": macd_line,
+        "macd_signal": macd_signal,
+        "macd_hist": macd_hist,
+        "bb_high": bb_high,
+        "bb_low": bb_low,
+        "bb_mid": bb_mid,
+        "bb_width": bb_high - bb_low,
+    }
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
@@ -26,10 +26,13 @@ class MarketRegime(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """
     Single trade recommendation produced by a strategy or the engine.
+
+    Slotted: no per instance __dict__, so construction and attribute access
+    are cheaper when scans emit many signals.
     """
 
     symbol: str
@@ -46,8 +49,22 @@ class TradeSignal:
 
     def to_dict(self) -> Dict:
         """Convert signal to a plain dict for JSON serialization."""
-        data = asdict(self)
-        data["action"] = self.action.value
-        data["risk_rating"] = self.risk_rating.value
-        data["regime"] = self.regime.value
-        return data
+        # Written out field by field: same result as asdict() with enum values,
+        # without its recursive deep copy
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "action": self.action.value,
+            "strategy_name": self.strategy_name,
+            "entry_zone": (
+                tuple(self.entry_zone) if self.entry_zone is not None else None
+            ),
+            "stop_loss": self.stop_loss,
+            "take_profits": (
+                list(self.take_profits) if self.take_profits is not None else None
+            ),
+            "risk_rating": self.risk_rating.value,
+            "confidence_score": self.confidence_score,
+            "regime": self.regime.value,
+            "context": dict(self.context),
+        }
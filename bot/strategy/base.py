@@ -1,11 +1,34 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, NamedTuple, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
-from bot.models import MarketRegime, TradeSignal
+from bot.indicators.context import SignalContext
+from bot.models import MarketRegime, TradeAction, TradeSignal
+
+
+class SignalArrays(NamedTuple):
+    """
+    Per bar signals for a whole candle frame.
+
+    actions holds 1 for BUY, -1 for SELL and 0 for no trade; stop_losses and
+    take_profits (first target) are NaN where there is no level.
+    """
+
+    actions: np.ndarray
+    stop_losses: np.ndarray
+    take_profits: np.ndarray
+
+    @classmethod
+    def empty(cls, n: int) -> "SignalArrays":
+        return cls(
+            actions=np.zeros(n, dtype=np.int8),
+            stop_losses=np.full(n, np.nan),
+            take_profits=np.full(n, np.nan),
+        )
 
 
 class BaseStrategy(ABC):
@@ -20,10 +43,66 @@ class BaseStrategy(ABC):
         symbol: str,
         timeframe: str,
         regime: MarketRegime,
+        ctx: Optional[SignalContext] = None,
     ) -> Optional[TradeSignal]:
         """
         Inspect the latest candles and emit a TradeSignal or None.
 
-        df is assumed to already have indicators added.
+        df is assumed to already have indicators added. ctx, when given, is a
+        SignalContext for df shared with the other strategies being run.
         """
         raise NotImplementedError
+
+    def generate_signals_batch(
+        self,
+        frames: Sequence[pd.DataFrame],
+        symbols: Sequence[str],
+        timeframe: str,
+        regimes: Sequence[MarketRegime],
+        contexts: Optional[Sequence[SignalContext]] = None,
+    ) -> List[Optional[TradeSignal]]:
+        """
+        generate_signal for the latest bar of many symbols at once.
+
+        Element i is what generate_signal returns for frames[i]. This default
+        calls it symbol by symbol; strategies override it to gate all symbols
+        with array operations first.
+        """
+        if contexts is None:
+            contexts = [SignalContext(df) for df in frames]
+        return [
+            self.generate_signal(df, symbol, timeframe, regime, ctx=ctx)
+            for df, symbol, regime, ctx in zip(frames, symbols, regimes, contexts)
+        ]
+
+    def precompute_signals(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        regimes: Sequence[MarketRegime],
+        start: int = 0,
+    ) -> SignalArrays:
+        """
+        Signal at every bar from `start` on, as generate_signal would emit it
+        seeing only the rows up to that bar.
+
+        df must have a positional index. This default replays generate_signal
+        on each prefix; strategies override it with a column-wise version.
+        """
+        signals = SignalArrays.empty(len(df))
+        for pos in range(start, len(df)):
+            signal = self.generate_signal(
+                df.iloc[: pos + 1], symbol, timeframe, regimes[pos]
+            )
+            if signal is None or signal.action not in (
+                TradeAction.BUY,
+                TradeAction.SELL,
+            ):
+                continue
+            signals.actions[pos] = 1 if signal.action == TradeAction.BUY else -1
+            if signal.stop_loss is not None:
+                signals.stop_losses[pos] = signal.stop_loss
+            if signal.take_profits:
+                signals.take_profits[pos] = signal.take_profits[0]
+        return signals
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+
+from bot.jit import njit
+
+
+@njit(cache=True)
+def atr_last(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+) -> float:
+    """
+    Latest simple-mean ATR, i.e. the last value of a rolling(period) mean of TR.
+
+    One pass over the trailing period bars. The first bar of the series has no
+    previous close, so its TR is just high - low. NaN with fewer than period bars.
+    """
+    n = close.shape[0]
+    if n < period:
+        return np.nan
+
+    total = 0.0
+    for i in range(n - period, n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            # Comparisons with a NaN close are false, so NaN never wins,
+            # as with DataFrame.max(axis=1)
+            up = abs(high[i] - prev_close)
+            down = abs(low[i] - prev_close)
+            if up > tr or tr != tr:
+                tr = up
+            if down > tr or tr != tr:
+                tr = down
+        total += tr
+    return total / period
+
+
+@njit(cache=True)
+def range_gate(
+    close: float,
+    rsi: float,
+    range_high: float,
+    range_low: float,
+    mean_close: float,
+    thresholds: np.ndarray,
+):
+    """
+    RangeReversion's decision for the latest bar.
+
+    thresholds holds max compression, support low/high, resistance low/high,
+    buy max RSI, sell min RSI, buy stop/target and sell stop/target
+    multipliers, in that order. Returns (action, stop_loss, take_profit,
+    compression) with action 1 for BUY, -1 for SELL and 0 for no trade;
+    compression is NaN when the range height is not positive.
+    """
+    range_height = range_high - range_low
+    if range_height <= 0:
+        return 0, np.nan, np.nan, np.nan
+
+    # Same as Python's max(mean_close, 1e-9), which keeps a NaN mean
+    denominator = mean_close
+    if 1e-9 > denominator:
+        denominator = 1e-9
+    compression = range_height / denominator
+    if compression > thresholds[0]:
+        return 0, np.nan, np.nan, compression
+
+    if (
+        range_low * thresholds[1] <= close <= range_low * thresholds[2]
+        and rsi < thresholds[5]
+    ):
+        return 1, range_low * thresholds[7], close * thresholds[8], compression
+    if (
+        range_high * thresholds[3] <= close <= range_high * thresholds[4]
+        and rsi > thresholds[6]
+    ):
+        return -1, range_high * thresholds[9], close * thresholds[10], compression
+    return 0, np.nan, np.nan, compression
@@ -1,13 +1,41 @@
 from __future__ import annotations
 
-from typing import Optional
+import logging
+from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from bot.models import MarketRegime, RiskRating, TradeAction, TradeSignal
+from bot.strategy.base import BaseStrategy, SignalArrays, SignalContext
+from bot.strategy.kernels import range_gate
 
 
-class RangeReversionStrategy:
+logger = logging.getLogger(__name__)
+
+
+def _range_stats(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> Tuple[float, float, float]:
+    """
+    Highest high, lowest low and mean close, skipping NaN bars like pandas.
+
+    The plain reductions are several times cheaper than the nan* variants, which
+    are only needed when a NaN made it into the window.
+    """
+    stats = (float(high.max()), float(low.min()), float(close.mean()))
+    if np.isnan(stats).any():
+        return (
+            float(np.nanmax(high)),
+            float(np.nanmin(low)),
+            float(np.nanmean(close)),
+        )
+    return stats
+
+
+class RangeReversionStrategy(BaseStrategy):
     """Fade extremes inside a sideways range."""
 
     name = "RangeReversion"
@@ -18,83 +46,233 @@ class RangeReversionStrategy:
     regimes = [MarketRegime.RANGE]
     risk_profile = "conservative"
 
+    # Thresholds shared by generate_signal, the batch gate and precompute_signals
+    _MAX_COMPRESSION = 0.08
+    _SUPPORT_LOW = 0.995
+    _SUPPORT_HIGH = 1.01
+    _RESISTANCE_LOW = 0.99
+    _RESISTANCE_HIGH = 1.005
+    _BUY_MAX_RSI = 38
+    _SELL_MIN_RSI = 62
+    _BUY_STOP = 0.99
+    _BUY_TARGET = 1.025
+    _SELL_STOP = 1.01
+    _SELL_TARGET = 0.975
+    # In the order range_gate reads them
+    _GATE_THRESHOLDS = np.array(
+        [
+            _MAX_COMPRESSION,
+            _SUPPORT_LOW,
+            _SUPPORT_HIGH,
+            _RESISTANCE_LOW,
+            _RESISTANCE_HIGH,
+            _BUY_MAX_RSI,
+            _SELL_MIN_RSI,
+            _BUY_STOP,
+            _BUY_TARGET,
+            _SELL_STOP,
+            _SELL_TARGET,
+        ]
+    )
+
     def generate_signal(
         self,
         df: pd.DataFrame,
         symbol: str,
         timeframe: str,
         regime: MarketRegime,
+        ctx: Optional[SignalContext] = None,
     ) -> Optional[TradeSignal]:
         if regime != MarketRegime.RANGE:
-            print("[RangeReversion] Skipped: regime not RANGE")
+            logger.debug("[RangeReversion] Skipped: regime not RANGE")
             return None
 
-        last = df.iloc[-1]
-        close = float(last["close"])
-        rsi = float(last["rsi14"])
-
-        recent = df.tail(50)
-        range_high = float(recent["high"].max())
-        range_low = float(recent["low"].min())
+        ctx = ctx or SignalContext(df)
 
-        range_height = range_high - range_low
-        if range_height <= 0:
-            print("[RangeReversion] Skipped: invalid range height")
-            return None
+        close = float(ctx.close_np[-1])
+        rsi = float(ctx.rsi14_np[-1])
+        if "range_high50" in ctx:
+            # 50 bar statistics precomputed by add_basic_indicators
+            range_high = float(ctx.column("range_high50")[-1])
+            range_low = float(ctx.column("range_low50")[-1])
+            mean_close = float(ctx.column("close_mean50")[-1])
+        else:
+            # Last 50 bars straight off the shared numpy columns, with no row
+            # Series or tail() frame
+            range_high, range_low, mean_close = _range_stats(
+                ctx.high_np[-50:], ctx.low_np[-50:], ctx.close_np[-50:]
+            )
 
-        # Require that price has been coiling; otherwise skip
-        compression = range_height / max(float(recent["close"].mean()), 1e-9)
-        if compression > 0.08:
-            print("[RangeReversion] Skipped: range too wide for mean reversion")
+        action, sl, tp, compression = range_gate(
+            close, rsi, range_high, range_low, mean_close, self._GATE_THRESHOLDS
+        )
+        if action == 0:
+            if compression != compression:
+                logger.debug("[RangeReversion] Skipped: invalid range height")
+            elif compression > self._MAX_COMPRESSION:
+                # Require that price has been coiling; otherwise skip
+                logger.debug(
+                    "[RangeReversion] Skipped: range too wide for mean reversion"
+                )
             return None
 
-        support_zone = (range_low * 0.995, range_low * 1.01)
-        resistance_zone = (range_high * 0.99, range_high * 1.005)
-
-        if support_zone[0] <= close <= support_zone[1] and rsi < 38:
-            sl = range_low * 0.99
-            tp = close * 1.025
+        context = {
+            "close": close,
+            "rsi14": rsi,
+            "range_low": range_low,
+            "range_high": range_high,
+            "compression": compression,
+        }
+        if action == 1:
             return TradeSignal(
                 symbol=symbol,
                 timeframe=timeframe,
                 action=TradeAction.BUY,
                 strategy_name=self.name,
-                entry_zone=support_zone,
+                entry_zone=(
+                    range_low * self._SUPPORT_LOW,
+                    range_low * self._SUPPORT_HIGH,
+                ),
                 stop_loss=sl,
                 take_profits=[tp],
                 risk_rating=RiskRating.MEDIUM,
                 confidence_score=0.6,
                 regime=regime,
-                context={
-                    "close": close,
-                    "rsi14": rsi,
-                    "range_low": range_low,
-                    "range_high": range_high,
-                    "compression": compression,
-                },
+                context=context,
             )
+        return TradeSignal(
+            symbol=symbol,
+            timeframe=timeframe,
+            action=TradeAction.SELL,
+            strategy_name=self.name,
+            entry_zone=(
+                range_high * self._RESISTANCE_LOW,
+                range_high * self._RESISTANCE_HIGH,
+            ),
+            stop_loss=sl,
+            take_profits=[tp],
+            risk_rating=RiskRating.HIGH,
+            confidence_score=0.6,
+            regime=regime,
+            context=context,
+        )
 
-        if resistance_zone[0] <= close <= resistance_zone[1] and rsi > 62:
-            sl = range_high * 1.01
-            tp = close * 0.975
-            return TradeSignal(
-                symbol=symbol,
-                timeframe=timeframe,
-                action=TradeAction.SELL,
-                strategy_name=self.name,
-                entry_zone=resistance_zone,
-                stop_loss=sl,
-                take_profits=[tp],
-                risk_rating=RiskRating.HIGH,
-                confidence_score=0.6,
-                regime=regime,
-                context={
-                    "close": close,
-                    "rsi14": rsi,
-                    "range_low": range_low,
-                    "range_high": range_high,
-                    "compression": compression,
-                },
+    def generate_signals_batch(
+        self,
+        frames: Sequence[pd.DataFrame],
+        symbols: Sequence[str],
+        timeframe: str,
+        regimes: Sequence[MarketRegime],
+        contexts: Optional[Sequence[SignalContext]] = None,
+    ) -> List[Optional[TradeSignal]]:
+        """
+        Gate every symbol's latest bar with array operations, then run
+        generate_signal only for the symbols that pass.
+
+        The gates are generate_signal's own (regime, range height, compression,
+        support/resistance zone with RSI), so the result is the same as calling
+        it for every symbol. Frames without the precomputed 50 bar columns skip
+        the gate and go straight to generate_signal.
+        """
+        n = len(frames)
+        if contexts is None:
+            contexts = [SignalContext(df) for df in frames]
+        columns = ("close", "rsi14", "range_high50", "range_low50", "close_mean50")
+        gated = [
+            pos
+            for pos, ctx in enumerate(contexts)
+            if len(ctx.df) and all(name in ctx for name in columns)
+        ]
+
+        candidate = np.ones(n, dtype=bool)
+        if gated:
+            def latest(name: str) -> np.ndarray:
+                return np.array([contexts[pos].column(name)[-1] for pos in gated])
+
+            close = latest("close")
+            rsi = latest("rsi14")
+            range_high = latest("range_high50")
+            range_low = latest("range_low50")
+            range_height = range_high - range_low
+            compression = range_height / np.maximum(latest("close_mean50"), 1e-9)
+
+            ok = np.array(
+                [regimes[pos] == MarketRegime.RANGE for pos in gated], dtype=bool
+            )
+            ok &= (range_height > 0) & (compression <= self._MAX_COMPRESSION)
+            buy = (
+                (range_low * self._SUPPORT_LOW <= close)
+                & (close <= range_low * self._SUPPORT_HIGH)
+                & (rsi < self._BUY_MAX_RSI)
+            )
+            sell = (
+                (range_high * self._RESISTANCE_LOW <= close)
+                & (close <= range_high * self._RESISTANCE_HIGH)
+                & (rsi > self._SELL_MIN_RSI)
+            )
+            candidate[gated] = ok & (buy | sell)
+
+        signals: List[Optional[TradeSignal]] = [None] * n
+        for pos in np.flatnonzero(candidate):
+            signals[pos] = self.generate_signal(
+                frames[pos], symbols[pos], timeframe, regimes[pos], ctx=contexts[pos]
             )
+        return signals
+
+    def precompute_signals(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        regimes: Sequence[MarketRegime],
+        start: int = 0,
+    ) -> SignalArrays:
+        """Column-wise generate_signal for every bar, without the per bar slicing."""
+
+        n = len(df)
+        signals = SignalArrays.empty(n)
+        if n == 0:
+            return signals
+
+        close = df["close"].to_numpy(dtype="float64")
+        rsi = df["rsi14"].to_numpy(dtype="float64")
+        if "range_high50" in df.columns:
+            range_high = df["range_high50"].to_numpy(dtype="float64")
+            range_low = df["range_low50"].to_numpy(dtype="float64")
+            mean_close = df["close_mean50"].to_numpy(dtype="float64")
+        else:
+            range_high = df["high"].rolling(50, min_periods=1).max().to_numpy()
+            range_low = df["low"].rolling(50, min_periods=1).min().to_numpy()
+            mean_close = df["close"].rolling(50, min_periods=1).mean().to_numpy()
+
+        range_height = range_high - range_low
+        compression = range_height / np.maximum(mean_close, 1e-9)
+        regime_ok = np.fromiter(
+            (regime == MarketRegime.RANGE for regime in regimes), dtype=bool, count=n
+        )
+        tradable = (
+            regime_ok & (range_height > 0) & (compression <= self._MAX_COMPRESSION)
+        )
+        tradable[:start] = False
+
+        buy = (
+            tradable
+            & (range_low * self._SUPPORT_LOW <= close)
+            & (close <= range_low * self._SUPPORT_HIGH)
+            & (rsi < self._BUY_MAX_RSI)
+        )
+        sell = (
+            tradable
+            & ~buy
+            & (range_high * self._RESISTANCE_LOW <= close)
+            & (close <= range_high * self._RESISTANCE_HIGH)
+            & (rsi > self._SELL_MIN_RSI)
+        )
 
-        return None
+        signals.actions[buy] = 1
+        signals.stop_losses[buy] = range_low[buy] * self._BUY_STOP
+        signals.take_profits[buy] = close[buy] * self._BUY_TARGET
+        signals.actions[sell] = -1
+        signals.stop_losses[sell] = range_high[sell] * self._SELL_STOP
+        signals.take_profits[sell] = close[sell] * self._SELL_TARGET
+        return signals
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 from bot.models import MarketRegime
 from bot.strategy.base import BaseStrategy
@@ -11,24 +13,33 @@ from bot.strategy.range_reversion import RangeReversionStrategy
 _trend_continuation = TrendContinuationStrategy()
 _range_reversion = RangeReversionStrategy()
 
-# Map regimes to strategies; UNKNOWN gets both so we always try something
-_REGISTRY: Dict[MarketRegime, List[BaseStrategy]] = {
-    MarketRegime.TREND_UP: [_trend_continuation],
-    MarketRegime.TREND_DOWN: [],
-    MarketRegime.RANGE: [_range_reversion],
-    MarketRegime.CHOPPY: [],
-    MarketRegime.BREAKOUT: [_trend_continuation],
-    MarketRegime.UNKNOWN: [_trend_continuation],
-}
-
-
-def get_strategy_registry() -> Dict[MarketRegime, List[BaseStrategy]]:
-    """Return mapping from market regime to list of strategies to run."""
+# Map regimes to strategies; UNKNOWN gets both so we always try something.
+# Read only, so callers can share it without defensive copies.
+_REGISTRY: Mapping[MarketRegime, Tuple[BaseStrategy, ...]] = MappingProxyType(
+    {
+        MarketRegime.TREND_UP: (_trend_continuation,),
+        MarketRegime.TREND_DOWN: (),
+        MarketRegime.RANGE: (_range_reversion,),
+        MarketRegime.CHOPPY: (),
+        MarketRegime.BREAKOUT: (_trend_continuation,),
+        MarketRegime.UNKNOWN: (_trend_continuation,),
+    }
+)
+
+
+def get_strategy_registry() -> Mapping[MarketRegime, Tuple[BaseStrategy, ...]]:
+    """Return the read only mapping from market regime to strategies to run."""
     return _REGISTRY
 
 
-def list_all_strategies() -> List[type[BaseStrategy]]:
-    """Return a list of all unique strategy classes registered across regimes."""
+@lru_cache(maxsize=1)
+def list_all_strategies() -> Tuple[type[BaseStrategy], ...]:
+    """
+    Return all unique strategy classes registered across regimes.
+
+    The registry is fixed at import time, so this is built once and the same
+    tuple is returned on every call.
+    """
     registry = get_strategy_registry()
     seen = set()
     strategies: List[type[BaseStrategy]] = []
@@ -38,4 +49,7 @@ def list_all_strategies() -> List[type[BaseStrategy]]:
             if cls not in seen:
                 seen.add(cls)
                 strategies.append(cls)
-    return strategies
+    return tuple(strategies)
+
+
+__all__ = ["get_strategy_registry", "list_all_strategies"]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional
+import logging
+from typing import List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from bot.models import (
@@ -10,9 +12,14 @@ from bot.models import (
     TradeAction,
     TradeSignal,
 )
+from bot.strategy.base import BaseStrategy, SignalArrays, SignalContext
+from bot.strategy.kernels import atr_last
 
 
-class TrendContinuationStrategy:
+logger = logging.getLogger(__name__)
+
+
+class TrendContinuationStrategy(BaseStrategy):
     """Bias long in clear uptrends with pullback entries."""
 
     name = "TrendContinuation"
@@ -29,31 +36,32 @@ class TrendContinuationStrategy:
         symbol: str,
         timeframe: str,
         regime: MarketRegime,
+        ctx: Optional[SignalContext] = None,
     ) -> Optional[TradeSignal]:
         """Return a TradeSignal if a valid trend continuation setup exists."""
 
         if regime != MarketRegime.TREND_UP:
-            print("[TrendContinuation] Skipped: regime not TREND_UP")
+            logger.debug("[TrendContinuation] Skipped: regime not TREND_UP")
             return None
 
-        last = df.iloc[-1]
-        close = float(last["close"])
-        ema20 = float(last.get("ema20", close))
-        ema50 = float(last.get("ema50", close * 0.99))
-        ema200 = float(last.get("ema200", ema50 * 0.99))
-        rsi = float(last.get("rsi14", 55.0))
+        ctx = ctx or SignalContext(df)
+        # ema20 and ema50 are required (their lookbacks below always read
+        # them); ema200 and rsi14 default as in precompute_signals
+        close = float(ctx.close_np[-1])
+        ema20 = float(ctx.ema20_np[-1])
+        ema50 = float(ctx.ema50_np[-1])
+        ema200 = float(ctx.ema200_np[-1]) if "ema200" in ctx else ema50 * 0.99
+        rsi = float(ctx.rsi14_np[-1]) if "rsi14" in ctx else 55.0
 
-        ema20_slope = (df["ema20"].iloc[-1] - df["ema20"].iloc[-8]) / max(
-            df["ema20"].iloc[-8], 1e-9
-        )
-        ema50_slope = (df["ema50"].iloc[-1] - df["ema50"].iloc[-13]) / max(
-            df["ema50"].iloc[-13], 1e-9
-        )
+        ema20_prev = float(ctx.ema20_np[-8])
+        ema50_prev = float(ctx.ema50_np[-13])
+        ema20_slope = (ema20 - ema20_prev) / max(ema20_prev, 1e-9)
+        ema50_slope = (ema50 - ema50_prev) / max(ema50_prev, 1e-9)
 
         # 1) Trend filter: EMAs stacked or at least 20 > 50 and price above 20
         ema_trend_ok = (ema20 > ema50 > ema200) and ema20_slope > 0.0005
         if not ema_trend_ok:
-            print("[TrendContinuation] Skipped: EMA alignment or slope weak")
+            logger.debug("[TrendContinuation] Skipped: EMA alignment or slope weak")
             return None
 
         # 2) Pullback zone: within a soft band around EMA20 / EMA50
@@ -65,33 +73,27 @@ class TrendContinuationStrategy:
         rsi_ok = 50 <= rsi <= 68
 
         if not (pullback_ok and rsi_ok):
-            print(
-                "[TrendContinuation] Skipped: pullback or RSI filter failed",
-                {"pullback_ok": pullback_ok, "rsi": rsi},
+            logger.debug(
+                "[TrendContinuation] Skipped: pullback or RSI filter failed "
+                "(pullback_ok=%s, rsi=%s)",
+                pullback_ok,
+                rsi,
             )
             return None
 
-        def _atr(data: pd.DataFrame, period: int = 14) -> float:
-            highs = data["high"]
-            lows = data["low"]
-            closes = data["close"]
-            prev_close = closes.shift(1)
-            tr = pd.concat(
-                [
-                    highs - lows,
-                    (highs - prev_close).abs(),
-                    (lows - prev_close).abs(),
-                ],
-                axis=1,
-            ).max(axis=1)
-            return float(tr.rolling(period).mean().iloc[-1])
-
-        recent_slice = df.tail(80)
-        atr = _atr(recent_slice)
+        # Precomputed by add_basic_indicators; frames built without it fall
+        # back to the kernel
+        if "atr14" in ctx:
+            atr = float(ctx.column("atr14")[-1])
+        else:
+            atr = float(atr_last(ctx.high_np, ctx.low_np, ctx.close_np, 14))
 
         # Stop loss at recent swing low with buffer informed by ATR
-        recent_lows = df["low"].tail(20)
+        # Plain min over the numpy view; nanmin only when a NaN got in
+        recent_lows = ctx.low_np[-20:]
         swing_low = float(recent_lows.min())
+        if swing_low != swing_low:
+            swing_low = float(np.nanmin(recent_lows))
         sl_buffer = atr * 0.8 if atr > 0 else swing_low * 0.003
         sl = min(swing_low - sl_buffer, close * 0.97)
 
@@ -124,3 +126,141 @@ class TrendContinuationStrategy:
                 "atr14": atr,
             },
         )
+
+    def generate_signals_batch(
+        self,
+        frames: Sequence[pd.DataFrame],
+        symbols: Sequence[str],
+        timeframe: str,
+        regimes: Sequence[MarketRegime],
+        contexts: Optional[Sequence[SignalContext]] = None,
+    ) -> List[Optional[TradeSignal]]:
+        """
+        Gate every symbol's latest bar with array operations, then run
+        generate_signal only for the symbols that pass.
+
+        The gates are generate_signal's own early exits (regime, EMA stack and
+        slope, pullback band, RSI), so the result is the same as calling it
+        for every symbol. Frames missing a column or with under 13 rows skip
+        the gate and go straight to generate_signal.
+        """
+        n = len(frames)
+        if contexts is None:
+            contexts = [SignalContext(df) for df in frames]
+        columns = ("close", "ema20", "ema50", "ema200", "rsi14")
+        gated = [
+            pos
+            for pos, ctx in enumerate(contexts)
+            if len(ctx.df) >= 13 and all(name in ctx for name in columns)
+        ]
+
+        candidate = np.ones(n, dtype=bool)
+        if gated:
+            # One row per symbol: close, the EMA stack, RSI and the EMA20 lookback
+            latest = np.array(
+                [
+                    (
+                        ctx.close_np[-1],
+                        ctx.ema20_np[-1],
+                        ctx.ema50_np[-1],
+                        ctx.ema200_np[-1],
+                        ctx.rsi14_np[-1],
+                        ctx.ema20_np[-8],
+                    )
+                    for ctx in (contexts[pos] for pos in gated)
+                ]
+            )
+            close, ema20, ema50, _, rsi, ema20_prev = latest.T
+            ema20_slope = (ema20 - ema20_prev) / np.maximum(ema20_prev, 1e-9)
+
+            # ema20 > ema50 > ema200 for every row at once
+            emas = latest[:, 1:4]
+            stacked = np.all(emas[:, :-1] > emas[:, 1:], axis=1)
+
+            ok = np.array(
+                [regimes[pos] == MarketRegime.TREND_UP for pos in gated], dtype=bool
+            )
+            ok &= stacked & (ema20_slope > 0.0005)
+            ok &= (np.minimum(ema20, ema50) * 0.985 <= close) & (close <= ema20 * 1.03)
+            ok &= (rsi >= 50) & (rsi <= 68)
+            candidate[gated] = ok
+
+        signals: List[Optional[TradeSignal]] = [None] * n
+        for pos in np.flatnonzero(candidate):
+            signals[pos] = self.generate_signal(
+                frames[pos], symbols[pos], timeframe, regimes[pos], ctx=contexts[pos]
+            )
+        return signals
+
+    def precompute_signals(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        regimes: Sequence[MarketRegime],
+        start: int = 0,
+    ) -> SignalArrays:
+        """Column-wise generate_signal for every bar, without the per bar slicing."""
+
+        n = len(df)
+        signals = SignalArrays.empty(n)
+        if n == 0:
+            return signals
+
+        close = df["close"].to_numpy(dtype="float64")
+        ema20 = df["ema20"].to_numpy(dtype="float64")
+        ema50 = df["ema50"].to_numpy(dtype="float64")
+        ema200 = (
+            df["ema200"].to_numpy(dtype="float64")
+            if "ema200" in df.columns
+            else ema50 * 0.99
+        )
+        rsi = (
+            df["rsi14"].to_numpy(dtype="float64")
+            if "rsi14" in df.columns
+            else np.full(n, 55.0)
+        )
+
+        # Bars without 8 bars of EMA history never produce a signal
+        ema20_prev = np.full(n, np.nan)
+        ema20_prev[7:] = ema20[:-7]
+        ema20_slope = (ema20 - ema20_prev) / np.maximum(ema20_prev, 1e-9)
+
+        ema_trend_ok = (ema20 > ema50) & (ema50 > ema200) & (ema20_slope > 0.0005)
+        pullback_band_low = np.minimum(ema20, ema50) * 0.985
+        pullback_band_high = ema20 * 1.03
+        pullback_ok = (pullback_band_low <= close) & (close <= pullback_band_high)
+        rsi_ok = (rsi >= 50) & (rsi <= 68)
+        regime_ok = np.fromiter(
+            (regime == MarketRegime.TREND_UP for regime in regimes), dtype=bool, count=n
+        )
+
+        # The 14 bar ATR only reaches back 15 rows, so the 80 row slice the
+        # single bar path takes never changes its value.
+        if "atr14" in df.columns:
+            atr = df["atr14"].to_numpy(dtype="float64")
+        else:
+            prev_close = df["close"].shift(1)
+            tr = pd.concat(
+                [
+                    df["high"] - df["low"],
+                    (df["high"] - prev_close).abs(),
+                    (df["low"] - prev_close).abs(),
+                ],
+                axis=1,
+            ).max(axis=1)
+            atr = tr.rolling(14).mean().to_numpy()
+        swing_low = df["low"].rolling(20, min_periods=1).min().to_numpy()
+
+        has_atr = atr > 0
+        sl_buffer = np.where(has_atr, atr * 0.8, swing_low * 0.003)
+        sl = np.minimum(swing_low - sl_buffer, close * 0.97)
+        tp1 = close + np.where(has_atr, atr * 1.4, close * 0.02)
+
+        buy = regime_ok & ema_trend_ok & pullback_ok & rsi_ok
+        buy[:start] = False
+
+        signals.actions[buy] = 1
+        signals.stop_losses[buy] = sl[buy]
+        signals.take_profits[buy] = tp1[buy]
+        return signals
@@ -1,10 +1,20 @@
+import os
+import sys
+
 import uvicorn
 
 
 if __name__ == "__main__":
+    # Pass --reload for local development; otherwise run one worker per core
+    reload = "--reload" in sys.argv[1:]
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
     uvicorn.run(
         "bot.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        workers=workers,
     )
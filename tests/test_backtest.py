@@ -0,0 +1,26 @@
+import numpy as np
+
+from bot.backtest.kernels import simulate_trades
+
+
+def test_simulate_trades_exit_rules():
+    nan = np.nan
+    high = np.array([101.0, 103.0, 100.0, 100.0, 99.0, 100.0])
+    low = np.array([99.0, 100.0, 94.0, 98.0, 97.0, 98.0])
+    close = np.array([100.0, 102.0, 95.0, 99.0, 98.0, 99.0])
+    # BUY with TP, BUY with SL, SELL closed by a BUY, BUY held to the end
+    actions = np.array([1, 1, 0, -1, 1, 0], dtype=np.int8)
+    stop_losses = np.array([90.0, 96.0, nan, nan, nan, nan])
+    take_profits = np.array([103.0, 110.0, nan, nan, nan, nan])
+
+    trades = simulate_trades(high, low, close, actions, stop_losses, take_profits)
+
+    np.testing.assert_allclose(
+        trades,
+        [
+            (103.0 - 100.0) / 100.0,
+            (96.0 - 102.0) / 102.0,
+            -(98.0 - 99.0) / 99.0,
+            (99.0 - 98.0) / 98.0,
+        ],
+    )
@@ -1,6 +1,18 @@
+import numpy as np
 import pandas as pd
+from ta.momentum import RSIIndicator
+from ta.trend import EMAIndicator, MACD
+from ta.volatility import BollingerBands
 
-from bot.indicators.core import add_basic_indicators
+from bot.indicators.core import (
+    _indicator_arrays,
+    _range_indicator_columns,
+    _wide_indicator_columns,
+    add_basic_indicators,
+    add_basic_indicators_batch,
+    add_basic_indicators_cached,
+)
+from bot.indicators.kernels import basic_indicator_arrays, range_indicator_arrays
 
 
 def test_add_basic_indicators_shapes():
@@ -16,3 +28,90 @@ def test_add_basic_indicators_shapes():
 
     for col in ["ema20", "ema50", "ema200", "rsi14", "macd", "macd_signal", "bb_high"]:
         assert col in df2.columns
+
+
+def test_add_basic_indicators_cached_reuses_unchanged_window():
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=30, freq="h"),
+            "open": [float(i) for i in range(30)],
+            "high": [float(i) + 1 for i in range(30)],
+            "low": [float(i) - 1 for i in range(30)],
+            "close": [float(i) for i in range(30)],
+            "volume": [100.0] * 30,
+        }
+    )
+    first = add_basic_indicators_cached(df, "TEST/USDT", "1h")
+    assert add_basic_indicators_cached(df.copy(), "TEST/USDT", "1h") is first
+
+    # A still-forming last bar that ticks must be recomputed
+    moved = df.copy()
+    moved.loc[moved.index[-1], "close"] = 100.0
+    assert add_basic_indicators_cached(moved, "TEST/USDT", "1h") is not first
+
+
+def test_add_basic_indicators_batch_matches_single():
+    rng = np.random.default_rng(7)
+    frames = []
+    for n in (260, 260, 120):
+        close = 100 + np.cumsum(rng.normal(0, 1, n))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "open": close,
+                    "high": close + 1,
+                    "low": close - 1,
+                    "close": close,
+                    "volume": [100.0] * n,
+                }
+            )
+        )
+
+    for single_df, batch_df in zip(
+        [add_basic_indicators(df) for df in frames],
+        add_basic_indicators_batch(frames),
+    ):
+        assert list(batch_df.columns) == list(single_df.columns)
+        np.testing.assert_allclose(
+            batch_df.to_numpy(dtype="float64"),
+            single_df.to_numpy(dtype="float64"),
+            rtol=1e-9,
+        )
+
+
+def test_indicator_kernels_match_ta():
+    rng = np.random.default_rng(11)
+    close = pd.Series(100 + np.cumsum(rng.normal(0, 1, 400)))
+    arrays = basic_indicator_arrays(close.to_numpy())
+    # pandas fallbacks used without numba
+    fallback = _indicator_arrays(close.to_numpy())
+    wide = _wide_indicator_columns(pd.DataFrame({"close": close}))
+
+    expected = {
+        "ema20": EMAIndicator(close=close, window=20).ema_indicator(),
+        "ema200": EMAIndicator(close=close, window=200).ema_indicator(),
+        "rsi14": RSIIndicator(close=close, window=14).rsi(),
+        "macd_signal": MACD(close=close).macd_signal(),
+        "bb_high": BollingerBands(close=close, window=20, window_dev=2).bollinger_hband(),
+    }
+    for name, series in expected.items():
+        np.testing.assert_allclose(arrays[name], series.to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(fallback[name], series.to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(
+            wide[name]["close"].to_numpy(), series.to_numpy(), rtol=1e-9
+        )
+
+
+def test_range_indicator_kernels_match_pandas():
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(0, 1, 300))
+    high = close + rng.random(300)
+    low = close - rng.random(300)
+    high[120] = np.nan
+
+    arrays = range_indicator_arrays(high, low, close)
+    expected = _range_indicator_columns(
+        pd.Series(high), pd.Series(low), pd.Series(close)
+    )
+    for name, series in expected.items():
+        np.testing.assert_allclose(arrays[name], series.to_numpy(), rtol=1e-9)
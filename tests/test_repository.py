@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from bot.data.repository import DataRepository, _select_candles_sql
+from bot.models import MarketRegime, RiskRating, TradeAction, TradeSignal
+
+
+def _candles(start: str, n: int, price: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start, periods=n, freq="h"),
+            "open": price,
+            "high": price + 1,
+            "low": price - 1,
+            "close": price,
+            "volume": 10.0,
+        }
+    )
+
+
+def test_save_and_load_candles_round_trip(tmp_path):
+    repo = DataRepository(db_path=str(tmp_path / "test.db"))
+    repo.save_candles("TEST/USDT", "1h", _candles("2024-01-01", 600, 100.0))
+    first = repo.load_candles("TEST/USDT", "1h")
+
+    # Existing bars are kept (INSERT OR IGNORE), new ones are appended
+    repo.save_candles("TEST/USDT", "1h", _candles("2024-01-25", 48, 200.0))
+    candles = repo.load_candles("TEST/USDT", "1h")
+
+    assert len(first) == 600
+    assert len(candles) == 624
+    assert candles["timestamp"].is_monotonic_increasing
+    assert candles["close"].iloc[599] == 100.0
+    assert candles["close"].iloc[-1] == 200.0
+
+    window = repo.load_candles(
+        "TEST/USDT",
+        "1h",
+        datetime(2024, 1, 2, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 23, tzinfo=timezone.utc),
+    )
+    assert len(window) == 24
+    repo.close()
+
+
+def test_load_candles_sees_candles_saved_by_another_repository(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    server = DataRepository(db_path=db_path)
+    writer = DataRepository(db_path=db_path)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 1, 5, 3, tzinfo=timezone.utc)
+
+    assert len(server.load_candles("TEST/USDT", "1h", start, end)) == 0
+    writer.save_candles("TEST/USDT", "1h", _candles("2024-01-01", 50, 100.0))
+    partial = server.load_candles("TEST/USDT", "1h", start, end)
+    assert len(partial) == 50
+
+    # Bars past the last stored one show up once written
+    writer.save_candles("TEST/USDT", "1h", _candles("2024-01-03 02:00", 50, 100.0))
+    complete = server.load_candles("TEST/USDT", "1h", start, end)
+    assert len(complete) == 100
+
+    # A range that reaches end is memoized
+    assert server.load_candles("TEST/USDT", "1h", start, end) is complete
+    writer.close()
+    server.close()
+
+
+def test_load_candles_query_uses_covering_index(tmp_path):
+    repo = DataRepository(db_path=str(tmp_path / "test.db"))
+    for has_start in (False, True):
+        for has_end in (False, True):
+            params = ["TEST/USDT", "1h"] + [0] * (has_start + has_end)
+            plan = " ".join(
+                row[-1]
+                for row in repo._conn.execute(
+                    "EXPLAIN QUERY PLAN " + _select_candles_sql(has_start, has_end),
+                    params,
+                )
+            )
+            assert "COVERING INDEX idx_candles_sym_tf_ts_ohlcv" in plan
+            assert "TEMP B-TREE" not in plan
+    repo.close()
+
+
+def _signal(symbol) -> TradeSignal:
+    return TradeSignal(
+        symbol=symbol,
+        timeframe="1h",
+        action=TradeAction.BUY,
+        strategy_name="TrendContinuation",
+        entry_zone=(99.0, 101.0),
+        stop_loss=95.0,
+        take_profits=[105.0, 110.0],
+        risk_rating=RiskRating.MEDIUM,
+        confidence_score=0.7,
+        regime=MarketRegime.TREND_UP,
+        context={},
+    )
+
+
+def test_logged_signals_are_visible_to_readers(tmp_path):
+    repo = DataRepository(db_path=str(tmp_path / "test.db"))
+    for pos in range(250):
+        repo.log_signal(_signal(f"SYM{pos}/USDT"))
+
+    # Queued rows are written before the read
+    signals = repo.get_recent_signals(limit=500)
+    assert sorted(row["symbol"] for row in signals) == sorted(
+        f"SYM{pos}/USDT" for pos in range(250)
+    )
+    repo.close()
+
+
+class _Unbindable:
+    """A parameter sqlite3 fails to adapt with a non sqlite3 exception."""
+
+    def __conform__(self, protocol):
+        raise ValueError("cannot bind")
+
+
+def test_failed_signal_row_does_not_stop_the_writer(tmp_path):
+    repo = DataRepository(db_path=str(tmp_path / "test.db"))
+    repo.log_signals([_signal("A/USDT"), _signal(_Unbindable()), _signal("B/USDT")])
+    assert sorted(row["symbol"] for row in repo.get_recent_signals()) == [
+        "A/USDT",
+        "B/USDT",
+    ]
+
+    # The writer is still running for rows logged afterwards
+    repo.log_signal(_signal("C/USDT"))
+    assert len(repo.get_recent_signals()) == 3
+    repo.close()
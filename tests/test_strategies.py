@@ -1,23 +1,29 @@
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 
+from bot.engine.regime import detect_regime, detect_regimes
 from bot.indicators.core import add_basic_indicators
 from bot.models import MarketRegime
+from bot.strategy.base import BaseStrategy
+from bot.strategy.range_reversion import RangeReversionStrategy
 from bot.strategy.trend_continuation import TrendContinuationStrategy
 
 
 def _mock_uptrend_df(n: int = 220) -> pd.DataFrame:
-    ts = [datetime.utcnow() - timedelta(minutes=5 * (n - i)) for i in range(n)]
-    close = [100 + i * 0.5 for i in range(n)]
+    ts = pd.date_range(
+        end=datetime.utcnow() - timedelta(minutes=5), periods=n, freq="5min"
+    )
+    close = 100 + np.arange(n, dtype=np.float64) * 0.5
     df = pd.DataFrame(
         {
             "timestamp": ts,
             "open": close,
-            "high": [c * 1.01 for c in close],
-            "low": [c * 0.99 for c in close],
+            "high": close * 1.01,
+            "low": close * 0.99,
             "close": close,
-            "volume": [1000] * n,
+            "volume": 1000,
         },
     )
     df = add_basic_indicators(df)
@@ -37,3 +43,98 @@ def test_trend_continuation_generates_buy_in_uptrend():
     )
     assert signal is not None
     assert signal.action.value == "BUY"
+
+
+def _mock_mixed_df(n: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    log_close = np.zeros(n)
+    for i in range(1, n):
+        log_close[i] = 0.95 * log_close[i - 1] + rng.normal(0, 0.003)
+    close = 100 * np.exp(log_close + np.linspace(0, 0.3, n))
+    df = pd.DataFrame(
+        {
+            "open": close,
+            "high": close * (1 + rng.uniform(0, 0.003, n)),
+            "low": close * (1 - rng.uniform(0, 0.003, n)),
+            "close": close,
+            "volume": 1000.0,
+        }
+    )
+    return add_basic_indicators(df).dropna().reset_index(drop=True)
+
+
+def _mock_regime_df(n: int = 900) -> pd.DataFrame:
+    """Up, down and flat stretches, so every regime shows up."""
+    rng = np.random.default_rng(7)
+    log_close = np.zeros(n)
+    for i in range(1, n):
+        log_close[i] = 0.95 * log_close[i - 1] + rng.normal(0, 0.002)
+    third = n // 3
+    drift = np.cumsum(
+        np.r_[np.full(third, 0.001), np.full(third, -0.001), np.zeros(n - 2 * third)]
+    )
+    close = 100 * np.exp(log_close + drift)
+    df = pd.DataFrame(
+        {
+            "open": close,
+            "high": close * (1 + rng.uniform(0, 0.003, n)),
+            "low": close * (1 - rng.uniform(0, 0.003, n)),
+            "close": close,
+            "volume": 1000.0,
+        }
+    )
+    return add_basic_indicators(df).dropna().reset_index(drop=True)
+
+
+def test_detect_regimes_matches_per_prefix_detect_regime():
+    df = _mock_regime_df()
+    expected = [detect_regime(df.iloc[: pos + 1]) for pos in range(len(df))]
+    result = detect_regimes(df)
+    assert list(result) == expected
+    assert set(expected) == {
+        MarketRegime.TREND_UP,
+        MarketRegime.TREND_DOWN,
+        MarketRegime.RANGE,
+        MarketRegime.CHOPPY,
+    }
+
+
+def test_precompute_signals_matches_per_bar_replay():
+    df = _mock_mixed_df()
+    for strat, active in (
+        (TrendContinuationStrategy(), MarketRegime.TREND_UP),
+        (RangeReversionStrategy(), MarketRegime.RANGE),
+    ):
+        # Each strategy's own regime, except every seventh bar
+        regimes = [active] * len(df)
+        regimes[::7] = [MarketRegime.CHOPPY] * len(regimes[::7])
+        expected = BaseStrategy.precompute_signals(
+            strat, df, "TEST/USDT", "1h", regimes, start=119
+        )
+        result = strat.precompute_signals(df, "TEST/USDT", "1h", regimes, start=119)
+        assert np.count_nonzero(expected.actions) > 0
+        np.testing.assert_array_equal(result.actions, expected.actions)
+        np.testing.assert_allclose(result.stop_losses, expected.stop_losses)
+        np.testing.assert_allclose(result.take_profits, expected.take_profits)
+
+
+def test_generate_signals_batch_matches_per_symbol_calls():
+    mixed = _mock_mixed_df()
+    # Every latest bar of the mixed series, plus a clean uptrend that buys
+    frames = [mixed.iloc[: pos + 1] for pos in range(150, 600, 15)]
+    frames.append(_mock_uptrend_df())
+    symbols = [f"SYM{pos}/USDT" for pos in range(len(frames))]
+
+    for strat, active in (
+        (TrendContinuationStrategy(), MarketRegime.TREND_UP),
+        (RangeReversionStrategy(), MarketRegime.RANGE),
+    ):
+        regimes = [active] * len(frames)
+        regimes[0] = MarketRegime.CHOPPY
+        expected = [
+            strat.generate_signal(df, symbol, "1h", regime)
+            for df, symbol, regime in zip(frames, symbols, regimes)
+        ]
+        result = strat.generate_signals_batch(frames, symbols, "1h", regimes)
+        assert result == expected
+        assert sum(sig is not None for sig in expected) >= 2